@@ -0,0 +1,80 @@
+"""
+데이터셋마다 캐시 codec 별 크기와 warm start 시간 (캐시에서 읽은 bytes 를 DataFrame 으로 복원하는 시간) 을 비교합니다.
+JSON 은 PolarsDataManager 와 같이 infer_schema_length=100000 으로 DataFrame 을 다시 만드는 시간까지 포함합니다.
+--redis-url 을 지정하면 RedisDataCache (chunk 저장) 로 읽는 시간을 잽니다.
+
+    poetry run python scripts/bench_cache_codec.py --rows 1000000 --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import time
+
+import polars as pl
+from synthetic import fiscal_frame
+from webtool.cache import RedisCache
+
+from src.core.utils.openapi.data_cache import RedisDataCache
+from src.core.utils.openapi.data_codec import ArrowDataCodec, BaseDataCodec, JsonDataCodec, ParquetDataCodec
+
+CODECS: dict[str, BaseDataCodec] = {
+    "json+gzip": JsonDataCodec(),
+    "arrow+zstd": ArrowDataCodec(),
+    "parquet+zstd": ParquetDataCodec(),
+}
+
+
+def welfare_frame(rows: int) -> pl.DataFrame:
+    """
+    gov_welfare 처럼 긴 문자열 컬럼과 Y/null 컬럼이 많은 합성 DataFrame
+    """
+    text = "지원 대상 및 선정 기준에 대한 설명입니다. " * 8
+    df = pl.DataFrame({"service_id": [f"WLF{i:08d}" for i in range(rows)]})
+    df = df.with_columns(pl.format("{} {}", pl.lit(text), pl.col("service_id")).alias(f"text_{i}") for i in range(8))
+    return df.with_columns(
+        pl.when(pl.int_range(pl.len()) % (i + 2) == 0).then(pl.lit("Y")).alias(f"JA{i:04d}") for i in range(40)
+    )
+
+
+def load(codec: BaseDataCodec, data: bytes) -> pl.DataFrame:
+    value = codec.decode(data)
+    return value if isinstance(value, pl.DataFrame) else pl.DataFrame(value, infer_schema_length=100000)
+
+
+async def main(args: argparse.Namespace):
+    datasets = {"open_fiscal": fiscal_frame(args.rows), "gov_welfare": welfare_frame(args.welfare_rows)}
+    redis = RedisCache(args.redis_url) if args.redis_url else None
+
+    for dataset, frame in datasets.items():
+        for name, codec in CODECS.items():
+            started = time.perf_counter()
+            data = codec.encode(frame)
+            encoded = time.perf_counter() - started
+
+            started = time.perf_counter()
+            load(codec, data)
+            warm = time.perf_counter() - started
+
+            line = (
+                f"🔹{dataset:<12} {name:<13} size={len(data) / 2**20:8.1f}MiB encode={encoded:6.2f}s warm={warm:6.2f}s"
+            )
+
+            if redis is not None:
+                cache = RedisDataCache(redis, key_prefix="bench:", codec=codec, chunk_size=1 << 20)
+                await cache.set_cache(dataset, frame)
+                started = time.perf_counter()
+                value = await cache.get_cache(dataset)
+                if not isinstance(value, pl.DataFrame):
+                    pl.DataFrame(value, infer_schema_length=100000)
+                line += f" redis={time.perf_counter() - started:6.2f}s"
+                await cache.delete_cache(dataset)
+
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--welfare-rows", type=int, default=10_000)
+    parser.add_argument("--redis-url")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,55 @@
+"""
+hash_df 의 시간과 최대 메모리 (RSS) 를 이전 구현 (전체 정렬 후 행 해시를 bytes 로 이어 붙이는 방식) 과 비교합니다.
+각 구현은 최대 메모리를 따로 재기 위해 별도 프로세스에서 실행합니다.
+
+    poetry run python scripts/bench_hash_df.py --rows 1000000
+"""
+
+import argparse
+import hashlib
+import resource
+import subprocess
+import sys
+import time
+
+import polars as pl
+from synthetic import fiscal_frame
+
+from src.core.utils.openapi.data_hash import hash_df
+
+
+def legacy_hash_df(df: pl.DataFrame) -> str:
+    df = df.select(df.columns).sort(by=sorted(df.columns))
+
+    hasher = hashlib.sha1()
+    hasher.update(b"".join(c.encode() + str(t).encode() for c, t in df.schema.items()))
+    hasher.update(b"".join(h.to_bytes(64) for h in df.hash_rows()))
+    return hasher.hexdigest()
+
+
+def run(impl: str, rows: int):
+    df = fiscal_frame(rows)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    started = time.perf_counter()
+    digest = hash_df(df) if impl == "hash_df" else legacy_hash_df(df)
+    elapsed = time.perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"🔹{impl:<14} rows={df.height} time={elapsed:.2f}s "
+        f"peak_rss={peak / 1024:.0f}MiB (+{(peak - before) / 1024:.0f}MiB over the frame) digest={digest[:12]}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--impl", choices=["hash_df", "legacy_hash_df"])
+    args = parser.parse_args()
+
+    if args.impl:
+        run(args.impl, args.rows)
+    else:
+        for impl in ("legacy_hash_df", "hash_df"):
+            subprocess.run([sys.executable, __file__, "--impl", impl, "--rows", str(args.rows)], check=True)
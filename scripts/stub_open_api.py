@@ -0,0 +1,96 @@
+"""
+OpenDataLoader 를 지연과 오류를 주입하는 로컬 stub 서버에 대해 실행합니다.
+
+    poetry run python scripts/stub_open_api.py --rows 2000 --latency 0.02 --error-rate 0.1 --capacity 6
+
+stub 서버는 totalCount / data 형식으로 페이지를 돌려주며,
+error-rate 의 확률로 429 (Retry-After 포함) 혹은 503 을, 동시 요청이 capacity 를 넘으면 503 을 돌려줍니다.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.core.utils.openapi.data_limiter import AdaptiveConcurrencyLimiter
+from src.core.utils.openapi.data_loader import OpenDataLoader, RetryPolicy
+
+
+def create_stub(rows: int, latency: float, error_rate: float, capacity: int) -> Starlette:
+    in_flight = 0
+    stats = {"requests": 0, "errors": 0, "peak": 0}
+
+    async def data(request: Request) -> JSONResponse:
+        nonlocal in_flight
+        in_flight += 1
+        stats["requests"] += 1
+        stats["peak"] = max(stats["peak"], in_flight)
+        try:
+            await asyncio.sleep(latency)
+            if in_flight > capacity:
+                stats["errors"] += 1
+                return JSONResponse({"message": "overloaded"}, status_code=503)
+            if random.random() < error_rate:
+                stats["errors"] += 1
+                if random.random() < 0.5:
+                    return JSONResponse({"message": "too many requests"}, status_code=429, headers={"Retry-After": "0"})
+                return JSONResponse({"message": "unavailable"}, status_code=503)
+
+            page = int(request.query_params.get("page", 1))
+            size = int(request.query_params.get("perPage", 10))
+            start = (page - 1) * size
+            items = [{"id": i, "value": f"row-{i}"} for i in range(start, min(start + size, rows))]
+            return JSONResponse({"page": page, "perPage": size, "totalCount": rows, "data": items})
+        finally:
+            in_flight -= 1
+
+    app = Starlette(routes=[Route("/data", data)])
+    app.state.stats = stats
+    return app
+
+
+async def main(args: argparse.Namespace):
+    app = create_stub(args.rows, args.latency, args.error_rate, args.capacity)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    serve = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=args.max_limit)
+    loader = OpenDataLoader(
+        f"http://127.0.0.1:{args.port}",
+        paths={"/data": {"get": {}}},
+        batch_size=args.batch_size,
+        retry_policy=RetryPolicy(max_retries=10, backoff_base=0.05, backoff_max=1.0),
+        limiter=limiter,
+    )
+
+    started = time.perf_counter()
+    try:
+        data = await loader.get_data("/data")
+    finally:
+        server.should_exit = True
+        await serve
+
+    stats = app.state.stats
+    ids = sorted(row["id"] for row in data)
+    print(f"🔹rows={len(data)} complete={ids == list(range(args.rows))} elapsed={time.perf_counter() - started:.2f}s")
+    print(f"🔹requests={stats['requests']} errors={stats['errors']} peak={stats['peak']} limit={limiter.limit:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    parser.add_argument("--capacity", type=int, default=6)
+    parser.add_argument("--max-limit", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,41 @@
+import numpy as np
+import polars as pl
+
+from src.app.open_api.model.fiscal import fiscal_key
+
+
+def fiscal_frame(rows: int = 1_000_000, seed: int = 0) -> pl.DataFrame:
+    """
+    open_fiscal 과 같은 컬럼과 타입을 가진 합성 DataFrame 을 만듭니다.
+    """
+    rng = np.random.default_rng(seed)
+    offices = [f"부처{i:02d}" for i in range(60)]
+
+    def names(prefix: str, n: int) -> pl.Series:
+        return pl.Series([f"{prefix}{i}" for i in rng.integers(0, n, rows)])
+
+    def amounts() -> pl.Series:
+        values = pl.Series(rng.integers(0, 10**9, rows), dtype=pl.Int64)
+        return values.scatter(rng.integers(0, rows, rows // 100), None)
+
+    df = pl.DataFrame(
+        {
+            "FSCL_YY": pl.Series(rng.integers(2007, 2027, rows), dtype=pl.Int64),
+            "OFFC_NM": pl.Series([offices[i] for i in rng.integers(0, len(offices), rows)]),
+            "FSCL_NM": names("회계", 40),
+            "ACCT_NM": names("계정", 5),
+            "FLD_NM": names("분야", 16),
+            "SECT_NM": names("부문", 80),
+            "PGM_NM": names("프로그램", 1500),
+            "ACTV_NM": names("단위사업", 8000),
+            "SACTV_NM": pl.Series([f"세부사업{i}" for i in range(rows)]),
+            "BZ_CLS_NM": names("구분", 6),
+            "FIN_DE_EP_NM": names("재정", 3),
+            "Y_PREY_FIRST_KCUR_AMT": amounts(),
+            "Y_PREY_FNL_FRC_AMT": amounts(),
+            "Y_YY_MEDI_KCUR_AMT": amounts(),
+            "Y_YY_DFN_MEDI_KCUR_AMT": amounts(),
+        }
+    )
+    df = df.with_columns(pl.col("OFFC_NM").rank("dense").cast(pl.Int32).sub(1).alias("NORMALIZED_DEPT_NO"))
+    return df.unique(subset=fiscal_key, maintain_order=True)
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import HTTPException, Query, Request
+from fastapi import HTTPException, Query
 from pydantic import ValidationError
 from sqlalchemy import desc
 
@@ -8,6 +8,7 @@ from src.app.map.schema.map import Coord2AddrDto, Coord2AddrResponse
 from src.core.config import settings
 from src.core.dependencies.auth import get_current_user
 from src.core.dependencies.db import postgres_session
+from src.core.dependencies.infra import http_clients
 
 
 class MapService:
@@ -16,15 +17,14 @@ class MapService:
 
     async def coord_to_addr(
         self,
-        request: Request,
         coord: Annotated[Coord2AddrDto, Query()],
     ) -> Coord2AddrResponse:
-        client = request.app.requests_client
+        client = http_clients.get("https://dapi.kakao.com")
         headers = {"Authorization": f"KakaoAK {settings.kakao_api.key}"}
         payload = coord.model_dump()
 
         response = await client.get(
-            "https://dapi.kakao.com/v2/local/geo/coord2address.json",
+            "/v2/local/geo/coord2address.json",
             headers=headers,
             params=payload,
         )
@@ -1,3 +1,5 @@
+from functools import partial
+
 from src.app.open_api.model.fiscal import (
     Fiscal,
     FiscalByYear,
@@ -5,6 +7,9 @@ from src.app.open_api.model.fiscal import (
     FiscalByYearOffc,
     FiscalByYearOffcDataSaver,
     FiscalDataSaver,
+    FiscalDepartmentRegistry,
+    fiscal_key,
+    normalize_fiscal,
 )
 from src.app.open_api.model.welfare import GovWelfare, GovWelfareSaver
 from src.app.open_api.repository.fiscal import FiscalByYearOffcRepository, FiscalByYearRepository, FiscalRepository
@@ -13,59 +18,90 @@ from src.app.open_api.service.fiscal import FiscalService
 from src.app.open_api.service.welfare import GovWelfareService
 from src.app.user.api.dependencies import user_data_repository
 from src.core.config import settings
-from src.core.dependencies.db import Postgres_sync, Redis
-from src.core.utils.openapi.data_cache import RedisDataCache
+from src.core.dependencies.db import Postgres, Postgres_sync, Redis
+from src.core.dependencies.infra import http_clients, nc
+from src.core.utils.openapi.data_cache import LocalDataCache, RedisDataCache
+from src.core.utils.openapi.data_codec import ParquetDataCodec
 from src.core.utils.openapi.data_loader import ApiConfig, FiscalDataLoader, OpenDataLoader
-from src.core.utils.openapi.data_manager import PolarsDataManager
+from src.core.utils.openapi.data_lock import PostgresDataLock, RedisDataLock
+from src.core.utils.openapi.data_manager import CallbackExecutor, FiscalPolarsDataManager, PolarsDataManager
+from src.core.utils.openapi.data_stage import PolarsDataStage
+from src.core.workers.refresh import DataRefreshWorker
 
-default_data_saver = RedisDataCache(Redis)
+default_data_saver = LocalDataCache(RedisDataCache(Redis, codec=ParquetDataCodec(), chunk_size=1 << 20), nc=nc)
+default_data_lock = PostgresDataLock(Postgres, key_prefix="open_api:")
+default_fill_lock = RedisDataLock(Redis, key_prefix="open_api:fill:")
+default_callback_executor = CallbackExecutor(max_pending=8)
+default_checkpoint = RedisDataCache(Redis, expire=86400, key_prefix="open_api:checkpoint:")
 
 fiscal_data_loader = FiscalDataLoader(
     base_url="http://openapi.openfiscaldata.go.kr",
     paths={"ExpenditureBudgetInit5": {"get": {}}, "TotalExpenditure5": {"get": {}}},
     api_config=ApiConfig(request_page="pIndex", request_size="pSize"),
+    checkpoint=default_checkpoint,
+    http_clients=http_clients,
 )
-fiscal_data_manager = PolarsDataManager(
+fiscal_data_manager = FiscalPolarsDataManager(
     fiscal_data_loader,
     default_data_saver,
     path="TotalExpenditure5",
     params={"Key": settings.open_fiscal_data_api.key, "Type": "JSON", "BDG_FND_DIV_CD": 0, "ANEXP_INQ_STND_CD": 1},
+    callback_executor=default_callback_executor,
+    data_lock=default_fill_lock,
+)
+fiscal_stage = PolarsDataStage(
+    fiscal_data_manager, transform=partial(normalize_fiscal, departments=FiscalDepartmentRegistry(Postgres_sync))
 )
 fiscal_data_saver = FiscalDataSaver(
     fiscal_data_manager,
     db=Postgres_sync,
     table=Fiscal,
+    loader="copy",
+    strategy="upsert",
+    key=fiscal_key,
+    stage=fiscal_stage,
 )
 fiscal_by_year_data_saver = FiscalByYearDataSaver(
     fiscal_data_manager,
     db=Postgres_sync,
     table=FiscalByYear,
+    strategy="swap",
+    stage=fiscal_stage,
 )
 fiscal_by_year_offc_data_saver = FiscalByYearOffcDataSaver(
     fiscal_data_manager,
     db=Postgres_sync,
     table=FiscalByYearOffc,
+    strategy="swap",
+    stage=fiscal_stage,
 )
 
 gov24_service_loader = OpenDataLoader(
     base_url="http://api.odcloud.kr/api",
     swagger_url="https://infuser.odcloud.kr/api/stages/44436/api-docs?1684891964110",
     api_key=settings.gov_24_data_api.key,
+    http_clients=http_clients,
 )
 gov24_service_list_manager = PolarsDataManager(
     gov24_service_loader,
     default_data_saver,
     path="/gov24/v3/serviceList",
+    callback_executor=default_callback_executor,
+    data_lock=default_fill_lock,
 )
 gov24_service_detail_manager = PolarsDataManager(
     gov24_service_loader,
     default_data_saver,
     path="/gov24/v3/serviceDetail",
+    callback_executor=default_callback_executor,
+    data_lock=default_fill_lock,
 )
 gov24_service_conditions_manager = PolarsDataManager(
     gov24_service_loader,
     default_data_saver,
     path="/gov24/v3/supportConditions",
+    callback_executor=default_callback_executor,
+    data_lock=default_fill_lock,
 )
 gov_welfare = GovWelfareSaver(
     gov24_service_list_manager,
@@ -73,6 +109,24 @@ gov_welfare = GovWelfareSaver(
     gov24_service_conditions_manager,
     db=Postgres_sync,
     table=GovWelfare,
+    strategy="upsert",
+    key=["service_id"],
+)
+
+data_managers = (
+    fiscal_data_manager,
+    gov24_service_conditions_manager,
+    gov24_service_detail_manager,
+    gov24_service_list_manager,
+)
+
+data_refresh_worker = DataRefreshWorker()
+data_refresh_worker.add(fiscal_data_manager, interval=settings.open_fiscal_data_api.refresh_interval)
+data_refresh_worker.add(
+    gov24_service_conditions_manager,
+    gov24_service_detail_manager,
+    gov24_service_list_manager,
+    interval=settings.gov_24_data_api.refresh_interval,
 )
 
 fiscal_repository = FiscalRepository(Fiscal)
@@ -1,6 +1,9 @@
+from collections.abc import Callable, Iterable, Mapping
+
 import polars as pl
-from sqlalchemy import BigInteger, Double, Index, Integer, Text
+from sqlalchemy import BigInteger, Double, Index, Integer, Text, insert, select
 from sqlalchemy.orm import Mapped, mapped_column
+from webtool.db import SyncDB
 
 from src.core.models.base import Base
 from src.core.utils.openapi.data_saver import PostgresDataSaver
@@ -12,56 +15,96 @@ mappings = [
     ["국가보훈처", "국가보훈부"],
 ]
 
+fiscal_key = [
+    "FSCL_YY",
+    "OFFC_NM",
+    "FSCL_NM",
+    "ACCT_NM",
+    "FLD_NM",
+    "SECT_NM",
+    "PGM_NM",
+    "ACTV_NM",
+    "SACTV_NM",
+    "BZ_CLS_NM",
+    "FIN_DE_EP_NM",
+]
 
-class FiscalDataSaver(PostgresDataSaver):
-    def build(self):
-        if not self.manager:
-            raise RuntimeError("manager not set")
-
-        df: pl.DataFrame = self.manager[0].data
-        df = df.drop("ANEXP_INQ_STND_CD")
-        df = df.with_columns(pl.col("OFFC_NM").fill_null("미정").alias("OFFC_NM"))
-
-        department_no = {k: v for v, k in enumerate(sorted(set(df["OFFC_NM"])))}
-        for mapping in mappings:
-            min_no = min([department_no[name] for name in mapping if department_no.get(name)])
-            department_no.update({name: min_no for name in mapping})
-
-        df = df.with_columns(
-            pl.col("FSCL_YY").str.to_integer().alias("FSCL_YY"),
-            pl.col("OFFC_NM")
-            .map_elements(lambda x: department_no.get(x, None), return_dtype=pl.Int8)
-            .alias("NORMALIZED_DEPT_NO"),
-        )
 
-        df = df.sort(by=["FSCL_YY", "NORMALIZED_DEPT_NO", "Y_YY_MEDI_KCUR_AMT"], maintain_order=True)
+def number_departments(names: Iterable[str], saved: Mapping[str, int] | None = None) -> dict[str, int]:
+    """
+    부처 이름에 번호를 부여합니다. saved 에 있는 번호는 그대로 두고, 새 이름에만 마지막 번호 다음부터 이름 순으로 부여합니다.
+    mappings 로 묶인 이름은 그중 가장 작은 번호를 함께 사용합니다.
+
+    Args:
+        names (Iterable[str]): 부처 이름
+        saved (Mapping[str, int]): 이미 부여된 번호
+    """
+    department_no = dict(saved or {})
+    new = sorted(set(names) - department_no.keys())
+    start = max(department_no.values(), default=-1) + 1
+    department_no.update(zip(new, range(start, start + len(new)), strict=True))
+
+    for mapping in mappings:
+        numbers = [department_no[name] for name in mapping if name in department_no]
+        if numbers:
+            department_no.update({name: min(numbers) for name in mapping if name in department_no})
+    return department_no
+
+
+class FiscalDepartmentRegistry:
+    """
+    부처 번호를 open_fiscal_department 테이블에 저장해 두고 새 부처에만 번호를 부여합니다.
+    새 부처가 추가되어도 다른 부처의 번호가 바뀌지 않으므로 open_fiscal 의 다른 행이 다시 쓰이지 않습니다.
+    """
+
+    def __init__(self, db: SyncDB):
+        self.db = db
+
+    def __call__(self, names: Iterable[str]) -> dict[str, int]:
+        table = FiscalDepartment.__table__
+        table.create(self.db.engine, checkfirst=True)
+
+        with self.db.engine.begin() as conn:
+            saved = dict(conn.execute(select(table.c.OFFC_NM, table.c.NORMALIZED_DEPT_NO)).all())
+            department_no = number_departments(names, saved)
+            added = [{"OFFC_NM": k, "NORMALIZED_DEPT_NO": v} for k, v in department_no.items() if k not in saved]
+            if added:
+                conn.execute(insert(table), added)
+        return department_no
+
+
+def normalize_fiscal(
+    df: pl.DataFrame,
+    departments: Callable[[Iterable[str]], dict[str, int]] = number_departments,
+) -> pl.DataFrame:
+    df = df.drop("ANEXP_INQ_STND_CD")
+    df = df.with_columns(pl.col("OFFC_NM").fill_null("미정").alias("OFFC_NM"))
+
+    department_no = departments(df["OFFC_NM"].unique().to_list())
+
+    df = df.with_columns(
+        pl.col("FSCL_YY").str.to_integer().alias("FSCL_YY"),
+        pl.col("OFFC_NM").replace_strict(department_no, return_dtype=pl.Int32).alias("NORMALIZED_DEPT_NO"),
+    )
 
-        return df
+    return df
 
 
-class FiscalByYearDataSaver(PostgresDataSaver):
-    def build(self):
-        if not self.manager:
-            raise RuntimeError("manager not set")
-
-        df: pl.DataFrame = self.manager[0].data
-        df = df.drop("ANEXP_INQ_STND_CD")
-        df = df.with_columns(pl.col("OFFC_NM").fill_null("미정").alias("OFFC_NM"))
-
-        department_no = {k: v for v, k in enumerate(sorted(set(df["OFFC_NM"])))}
-        for mapping in mappings:
-            min_no = min([department_no[name] for name in mapping if department_no.get(name)])
-            department_no.update({name: min_no for name in mapping})
-
-        df = df.with_columns(
-            pl.col("FSCL_YY").str.to_integer().alias("FSCL_YY"),
-            pl.col("OFFC_NM")
-            .map_elements(lambda x: department_no.get(x, None), return_dtype=pl.Int8)
-            .alias("NORMALIZED_DEPT_NO"),
+class FiscalDataSaver(PostgresDataSaver):
+    def plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        # API 는 fiscal_key 가 같은 예산 행을 여러 개 돌려주기도 하므로 금액을 더해 한 행으로 합칩니다.
+        amounts = [col for col in lf.collect_schema().names() if col.endswith("_AMT")]
+        lf = lf.group_by(fiscal_key, maintain_order=True).agg(
+            pl.exclude(*fiscal_key, *amounts).first(),
+            *(pl.when(pl.col(col).is_not_null().any()).then(pl.col(col).sum()).alias(col) for col in amounts),
         )
+        return lf.sort(by=["FSCL_YY", "NORMALIZED_DEPT_NO", "Y_YY_MEDI_KCUR_AMT"], maintain_order=True)
+
 
-        df = (
-            df.group_by("FSCL_YY")
+class FiscalByYearDataSaver(PostgresDataSaver):
+    def plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        lf = (
+            lf.group_by("FSCL_YY")
             .agg(
                 pl.col("Y_YY_MEDI_KCUR_AMT").sum().alias("Y_YY_MEDI_KCUR_AMT"),
                 pl.col("Y_YY_DFN_MEDI_KCUR_AMT").sum().alias("Y_YY_DFN_MEDI_KCUR_AMT"),
@@ -71,38 +114,17 @@ class FiscalByYearDataSaver(PostgresDataSaver):
             .with_columns(pl.col("Y_YY_DFN_MEDI_KCUR_AMT").pct_change().alias("Y_YY_DFN_MEDI_KCUR_AMT_PCT"))
         )
 
-        df = df.sort(by=["FSCL_YY", "Y_YY_MEDI_KCUR_AMT"], maintain_order=True)
-
-        return df
+        return lf.sort(by=["FSCL_YY", "Y_YY_MEDI_KCUR_AMT"], maintain_order=True)
 
 
 class FiscalByYearOffcDataSaver(PostgresDataSaver):
-    def build(self):
-        if not self.manager:
-            raise RuntimeError("manager not set")
-
-        df: pl.DataFrame = self.manager[0].data
-        df = df.drop("ANEXP_INQ_STND_CD")
-        df = df.with_columns(pl.col("OFFC_NM").fill_null("미정").alias("OFFC_NM"))
-
-        department_no = {k: v for v, k in enumerate(sorted(set(df["OFFC_NM"])))}
-        for mapping in mappings:
-            min_no = min([department_no[name] for name in mapping if department_no.get(name)])
-            department_no.update({name: min_no for name in mapping})
-
-        df = df.with_columns(
-            pl.col("FSCL_YY").str.to_integer().alias("FSCL_YY"),
-            pl.col("OFFC_NM")
-            .map_elements(lambda x: department_no.get(x, None), return_dtype=pl.Int8)
-            .alias("NORMALIZED_DEPT_NO"),
-        )
-
-        df = (
-            df.group_by(["FSCL_YY", "NORMALIZED_DEPT_NO", "OFFC_NM"])
+    def plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        lf = (
+            lf.group_by(["FSCL_YY", "NORMALIZED_DEPT_NO", "OFFC_NM"])
             .agg(
                 pl.col("Y_YY_MEDI_KCUR_AMT").sum().alias("Y_YY_MEDI_KCUR_AMT"),
                 pl.col("Y_YY_DFN_MEDI_KCUR_AMT").sum().alias("Y_YY_DFN_MEDI_KCUR_AMT"),
-                pl.count().alias("COUNT"),
+                pl.len().alias("COUNT"),
             )
             .sort(["NORMALIZED_DEPT_NO", "FSCL_YY"])
             .with_columns(
@@ -116,9 +138,7 @@ class FiscalByYearOffcDataSaver(PostgresDataSaver):
             )
         )
 
-        df = df.sort(by=["FSCL_YY", "NORMALIZED_DEPT_NO", "Y_YY_MEDI_KCUR_AMT"], maintain_order=True)
-
-        return df
+        return lf.sort(by=["FSCL_YY", "NORMALIZED_DEPT_NO", "Y_YY_MEDI_KCUR_AMT"], maintain_order=True)
 
 
 class Fiscal(Base):
@@ -148,6 +168,12 @@ class Fiscal(Base):
             "ix_for_open_fiscal_Fiscal_DFN",
             *("FSCL_YY", "NORMALIZED_DEPT_NO", "Y_YY_DFN_MEDI_KCUR_AMT"),
         ),
+        Index(
+            "ux_for_open_fiscal_key",
+            *fiscal_key,
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -170,6 +196,13 @@ class Fiscal(Base):
     Y_YY_DFN_MEDI_KCUR_AMT: Mapped[int] = mapped_column(BigInteger, nullable=True)
 
 
+class FiscalDepartment(Base):
+    __tablename__ = "open_fiscal_department"
+
+    OFFC_NM: Mapped[str] = mapped_column(Text, primary_key=True)
+    NORMALIZED_DEPT_NO: Mapped[int] = mapped_column(Integer)
+
+
 class FiscalByYear(Base):
     __tablename__ = "open_fiscal_by_year"
     __table_args__ = (
@@ -36,23 +36,25 @@ columns_mapping = {
 
 
 class GovWelfareSaver(PostgresDataSaver):
-    def build(self):
+    def build_lazy(self) -> pl.LazyFrame:
         path_order = {"/gov24/v3/serviceList": 1, "/gov24/v3/serviceDetail": 2, "/gov24/v3/supportConditions": 3}
         self.manager = tuple(sorted(self.manager, key=lambda manager: path_order.get(manager.path, float("inf"))))
 
-        df = join(*[m.data for m in self.manager], by=["서비스ID"]).sort("서비스ID")
-        df = df.rename(columns_mapping)
-        df = df.drop(["자치법규", "행정규칙", "문의처", "접수기관명"], strict=False)
-        df = df.filter(df["user_type"].str.contains("개인") | df["user_type"].str.contains("가구"))
-        df = cast_y_null_to_bool(df)
-        df = df.with_columns(pl.col("views").fill_null("0").cast(pl.Int32))
-        df = df.with_columns(
+        lf = join(*[m.data.lazy() for m in self.manager], by=["서비스ID"])
+        lf = lf.rename(columns_mapping)
+        lf = lf.drop(["자치법규", "행정규칙", "문의처", "접수기관명"], strict=False)
+        lf = lf.filter(pl.col("user_type").str.contains("개인") | pl.col("user_type").str.contains("가구"))
+        lf = cast_y_null_to_bool(
+            lf, [column.name for column in self.table.__table__.columns if isinstance(column.type, Boolean)]
+        )
+        lf = lf.with_columns(pl.col("views").fill_null("0").cast(pl.Int32))
+        lf = lf.with_columns(
             pl.col("created_at").str.strptime(dtype=pl.Datetime, format="%Y%m%d%H%M%S").alias("created_at"),
             pl.col("updated_at").str.strptime(dtype=pl.Datetime, format="%Y%m%d%H%M%S").alias("updated_at"),
         )
-        df = df.sort(by=["updated_at", "service_id"], descending=[True, False], maintain_order=True)
+        lf = lf.sort(by=["updated_at", "service_id"], descending=[True, False], maintain_order=True)
 
-        return df
+        return lf
 
 
 class GovWelfare(Base):
@@ -86,6 +88,11 @@ class GovWelfare(Base):
             "ix_for_organization",
             *("JA2101", "JA2102", "JA2103", "JA2201", "JA2202", "JA2203", "JA2299"),
         ),
+        Index(
+            "ux_for_gov_welfare_service_id",
+            *("service_id",),
+            unique=True,
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 class FiscalByYearDto(BaseModel):
     page: int = Field(0, ge=0, description="Page number")
     size: int = Field(50, ge=1, le=100, description="Page size")
+    cursor: str | None = Field(default=None, description="Cursor from the X-Next-Cursor header, used instead of page")
     start_year: str | None = Field(default=None)
     end_year: str | None = Field(default=None)
     order_by: str = Field(default="FSCL_YY")
@@ -12,6 +13,7 @@ class FiscalByYearDto(BaseModel):
 class FiscalByYearOffcDto(BaseModel):
     page: int = Field(0, ge=0, description="Page number")
     size: int = Field(50, ge=1, le=100, description="Page size")
+    cursor: str | None = Field(default=None, description="Cursor from the X-Next-Cursor header, used instead of page")
     start_year: str | None = Field(default=None)
     end_year: str | None = Field(default=None)
     offc_name: str | None = Field(default=None)
@@ -22,6 +24,7 @@ class FiscalByYearOffcDto(BaseModel):
 class FiscalDto(BaseModel):
     page: int = Field(0, ge=0, description="Page number")
     size: int = Field(50, ge=1, le=100, description="Page size")
+    cursor: str | None = Field(default=None, description="Cursor from the X-Next-Cursor header, used instead of page")
     start_year: str | None = Field(default=None)
     end_year: str | None = Field(default=None)
     offc_name: str | None = Field(default=None)
@@ -4,5 +4,6 @@ from pydantic import BaseModel, Field
 class WelfareDto(BaseModel):
     page: int = Field(0, ge=0, description="Page number")
     size: int = Field(10, ge=1, le=20, description="Page size")
+    cursor: str | None = Field(default=None, description="Cursor from the X-Next-Cursor header, used instead of page")
     tag: str = Field(default="")
     order_by: str = Field(default="views")
@@ -1,11 +1,12 @@
+from collections.abc import Callable
 from typing import Annotated
 
-from fastapi import Query
-from sqlalchemy import desc
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import bindparam, desc
 
 from src.app.open_api.repository.fiscal import FiscalByYearOffcRepository, FiscalByYearRepository, FiscalRepository
 from src.app.open_api.schema.fiscal import FiscalByYearDto, FiscalByYearOffcDto, FiscalDto
-from src.core.dependencies.db import postgres_session
+from src.core.dependencies.db import postgres_read_session
 
 
 class FiscalService:
@@ -19,73 +20,90 @@ class FiscalService:
         self.fiscal_by_year_repository = fiscal_by_year_repository
         self.fiscal_by_year_offc_repository = fiscal_by_year_offc_repository
 
+    @staticmethod
+    def _get_filters(model, data) -> tuple[tuple, Callable[[], list], dict]:
+        """
+        쿼리 모양과 조건을 만드는 함수, bindparam 에 넘길 값을 함께 돌려줍니다.
+        """
+        dept_code = getattr(data, "dept_code", None)
+        offc_name = None if dept_code else getattr(data, "offc_name", None)
+        shape = (bool(data.start_year), bool(data.end_year), bool(dept_code), bool(offc_name))
+        params = {
+            "start_year": int(data.start_year) if data.start_year else None,
+            "end_year": int(data.end_year) if data.end_year else None,
+            "dept_code": dept_code,
+            "offc_name": offc_name,
+        }
+
+        def factory() -> list:
+            filters = []
+            if data.start_year:
+                filters.append(model.FSCL_YY >= bindparam("start_year"))
+            if data.end_year:
+                filters.append(model.FSCL_YY <= bindparam("end_year"))
+            if dept_code:
+                filters.append(model.NORMALIZED_DEPT_NO == bindparam("dept_code"))
+            elif offc_name:
+                filters.append(model.OFFC_NM == bindparam("offc_name"))
+            return filters
+
+        return shape, factory, {k: v for k, v in params.items() if v is not None}
+
+    @classmethod
+    async def _get_page(cls, repository, session, response: Response, data):
+        column = getattr(repository.model, data.order_by)
+        shape, filters, params = cls._get_filters(repository.model, data)
+        shape = (*shape, data.order_by)
+
+        if data.cursor is None:
+            result = await repository.get_page(
+                session,
+                data.page,
+                data.size,
+                filters=filters,
+                orderby=[desc(column), desc(repository.model.id)],
+                shape=shape,
+                params=params,
+            )
+        else:
+            try:
+                result = await repository.get_cursor_page(
+                    session,
+                    data.size,
+                    filters=filters,
+                    order_column=column,
+                    cursor=data.cursor,
+                    shape=shape,
+                    params=params,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        rows = result.mappings().all()
+        if next_cursor := repository.get_next_cursor(rows, column, data.size):
+            response.headers["X-Next-Cursor"] = next_cursor
+        return rows
+
     async def get_fiscal(
         self,
-        session: postgres_session,
+        session: postgres_read_session,
+        response: Response,
         data: Annotated[FiscalDto, Query()],
     ):
-        filters = []
-        if data.start_year:
-            filters.append(self.fiscal_repository.model.FSCL_YY >= int(data.start_year))
-        if data.end_year:
-            filters.append(self.fiscal_repository.model.FSCL_YY <= int(data.end_year))
-        if data.dept_code:
-            filters.append(self.fiscal_repository.model.NORMALIZED_DEPT_NO == data.dept_code)
-        elif data.offc_name:
-            filters.append(self.fiscal_repository.model.OFFC_NM == data.offc_name)
-
-        result = await self.fiscal_repository.get_page(
-            session,
-            data.page,
-            data.size,
-            filters=filters,
-            orderby=[desc(getattr(self.fiscal_repository.model, data.order_by))],
-        )
-
-        return result.mappings().all()
+        return await self._get_page(self.fiscal_repository, session, response, data)
 
     async def get_fiscal_by_year(
         self,
-        session: postgres_session,
+        session: postgres_read_session,
+        response: Response,
         data: Annotated[FiscalByYearDto, Query()],
     ):
-        filters = []
-        if data.start_year:
-            filters.append(self.fiscal_by_year_repository.model.FSCL_YY >= int(data.start_year))
-        if data.end_year:
-            filters.append(self.fiscal_by_year_repository.model.FSCL_YY <= int(data.end_year))
-
-        result = await self.fiscal_by_year_repository.get_page(
-            session,
-            data.page,
-            data.size,
-            filters=filters,
-            orderby=[desc(getattr(self.fiscal_by_year_repository.model, data.order_by))],
-        )
-
-        return result.mappings().all()
+        return await self._get_page(self.fiscal_by_year_repository, session, response, data)
 
     async def get_fiscal_by_year_offc(
         self,
-        session: postgres_session,
+        session: postgres_read_session,
+        response: Response,
         data: Annotated[FiscalByYearOffcDto, Query()],
     ):
-        filters = []
-        if data.start_year:
-            filters.append(self.fiscal_by_year_offc_repository.model.FSCL_YY >= int(data.start_year))
-        if data.end_year:
-            filters.append(self.fiscal_by_year_offc_repository.model.FSCL_YY <= int(data.end_year))
-        if data.dept_code:
-            filters.append(self.fiscal_by_year_offc_repository.model.NORMALIZED_DEPT_NO == data.dept_code)
-        elif data.offc_name:
-            filters.append(self.fiscal_by_year_offc_repository.model.OFFC_NM == data.offc_name)
-
-        result = await self.fiscal_by_year_offc_repository.get_page(
-            session,
-            data.page,
-            data.size,
-            filters=filters,
-            orderby=[desc(getattr(self.fiscal_by_year_offc_repository.model, data.order_by))],
-        )
-
-        return result.mappings().all()
+        return await self._get_page(self.fiscal_by_year_offc_repository, session, response, data)
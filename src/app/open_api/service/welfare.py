@@ -1,22 +1,58 @@
 from datetime import datetime
 from typing import Annotated, Sequence
 
-from fastapi import HTTPException, Query
-from sqlalchemy import and_, desc, or_
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, bindparam, desc, or_
 
 from src.app.open_api.repository.welfare import GovWelfareRepository
 from src.app.open_api.schema.welfare import WelfareDto
 from src.app.user.model.user_data import AcademicStatus, UserData
 from src.app.user.repository.user_data import UserDataRepository
 from src.core.dependencies.auth import User, get_current_user_without_error
-from src.core.dependencies.db import postgres_session
+from src.core.dependencies.db import PostgresRead, postgres_read_session, postgres_session
+from src.core.utils.streaming import StreamFormat, stream_response
 
 
 class GovWelfareService:
+    _user_data_fields = (
+        "multicultural",
+        "north_korean",
+        "single_parent_or_grandparent",
+        "multi_child_family",
+        "homeless",
+        "new_resident",
+        "extend_family",
+        "disable",
+        "veteran",
+        "disease",
+        "prospective_parents_or_infertility",
+        "pregnant",
+        "childbirth_or_adoption",
+        "farmers",
+        "fishermen",
+        "livestock_farmers",
+        "forestry_workers",
+    )
+
     def __init__(self, repository: GovWelfareRepository, user_data_repository: UserDataRepository):
         self.repository = repository
         self.user_data_repository = user_data_repository
 
+    @staticmethod
+    def _bind(name: str, value):
+        """
+        값을 bindparam 으로 감싸 같은 모양의 쿼리를 재사용할 수 있도록 합니다. None 은 IS NULL 로 남겨둡니다.
+        """
+        return None if value is None else bindparam(name, value)
+
+    @staticmethod
+    def _get_age(user: User) -> int | None:
+        if user.birthdate is None:
+            return None
+        now = datetime.now()
+        age = now.year - user.birthdate.year
+        return age - 1 if (now.month, now.day) < (user.birthdate.month, user.birthdate.day) else age
+
     @staticmethod
     def _user_data_filter(
         user_data: UserData,
@@ -43,9 +79,7 @@ class GovWelfareService:
     def _age_filter(self, user: User):
         if user.birthdate is None:
             return None
-        now = datetime.now()
-        age = now.year - user.birthdate.year
-        age = age - 1 if (now.month, now.day) < (user.birthdate.month, user.birthdate.day) else age
+        age = bindparam("age", self._get_age(user))
         return and_(
             or_(
                 self.repository.model.JA0110 <= age,
@@ -105,15 +139,16 @@ class GovWelfareService:
         if user_data is None:
             return None
         return or_(
-            self.repository.model.JA0401 == user_data.multicultural,
-            self.repository.model.JA0402 == user_data.north_korean,
-            self.repository.model.JA0403 == user_data.single_parent_or_grandparent,
+            self.repository.model.JA0401 == self._bind("multicultural", user_data.multicultural),
+            self.repository.model.JA0402 == self._bind("north_korean", user_data.north_korean),
+            self.repository.model.JA0403
+            == self._bind("single_parent_or_grandparent", user_data.single_parent_or_grandparent),
             self.repository.model.JA0404 == True if user_data.household_size == 1 else None,
             self.repository.model.JA0410 == True,
-            self.repository.model.JA0411 == user_data.multi_child_family,
-            self.repository.model.JA0412 == user_data.homeless,
-            self.repository.model.JA0413 == user_data.new_resident,
-            self.repository.model.JA0414 == user_data.extend_family,
+            self.repository.model.JA0411 == self._bind("multi_child_family", user_data.multi_child_family),
+            self.repository.model.JA0412 == self._bind("homeless", user_data.homeless),
+            self.repository.model.JA0413 == self._bind("new_resident", user_data.new_resident),
+            self.repository.model.JA0414 == self._bind("extend_family", user_data.extend_family),
             and_(
                 self.repository.model.JA0401 == False,
                 self.repository.model.JA0402 == False,
@@ -131,28 +166,29 @@ class GovWelfareService:
         if user_data is None:
             return None
         return or_(
-            self.repository.model.JA0328 == user_data.disable,
-            self.repository.model.JA0329 == user_data.veteran,
-            self.repository.model.JA0330 == user_data.disease,
+            self.repository.model.JA0328 == self._bind("disable", user_data.disable),
+            self.repository.model.JA0329 == self._bind("veteran", user_data.veteran),
+            self.repository.model.JA0330 == self._bind("disease", user_data.disease),
         )
 
     def _life_status_filter(self, user_data: UserData):
         if user_data is None:
             return None
         return or_(
-            self.repository.model.JA0301 == user_data.prospective_parents_or_infertility,
-            self.repository.model.JA0302 == user_data.pregnant,
-            self.repository.model.JA0303 == user_data.childbirth_or_adoption,
+            self.repository.model.JA0301
+            == self._bind("prospective_parents_or_infertility", user_data.prospective_parents_or_infertility),
+            self.repository.model.JA0302 == self._bind("pregnant", user_data.pregnant),
+            self.repository.model.JA0303 == self._bind("childbirth_or_adoption", user_data.childbirth_or_adoption),
         )
 
     def _primary_industry_status_filter(self, user_data: UserData):
         if user_data is None:
             return None
         return or_(
-            self.repository.model.JA0313 == user_data.farmers,
-            self.repository.model.JA0314 == user_data.fishermen,
-            self.repository.model.JA0315 == user_data.livestock_farmers,
-            self.repository.model.JA0316 == user_data.forestry_workers,
+            self.repository.model.JA0313 == self._bind("farmers", user_data.farmers),
+            self.repository.model.JA0314 == self._bind("fishermen", user_data.fishermen),
+            self.repository.model.JA0315 == self._bind("livestock_farmers", user_data.livestock_farmers),
+            self.repository.model.JA0316 == self._bind("forestry_workers", user_data.forestry_workers),
         )
 
     def _academic_status_filter(self, user_data: UserData):
@@ -171,19 +207,47 @@ class GovWelfareService:
                 [self.repository.model.JA0322 == True],
             )
 
+    def _get_shape(self, user: User | None, user_data: UserData | None, data: WelfareDto) -> tuple[tuple, dict]:
+        """
+        추천 쿼리의 모양을 정하는 값과 bindparam 에 넘길 값을 나눕니다.
+        모양이 같은 요청은 조건을 다시 만들지 않고 캐시된 쿼리를 그대로 실행합니다.
+        """
+        params = {}
+        shape = None
+        if user_data:
+            values = {name: getattr(user_data, name) for name in self._user_data_fields}
+            params = {k: v for k, v in values.items() if v is not None}
+            if user.birthdate is not None:
+                params["age"] = self._get_age(user)
+            shape = (
+                tuple(k for k, v in values.items() if v is None),
+                user_data.academic_status,
+                user_data.household_size,
+                user_data.overcome is None,
+                user.gender if user.gender in ("male", "female") else None,
+                user.birthdate is None,
+            )
+        if data.tag:
+            params["tag"] = data.tag
+        return (shape, bool(data.tag), data.order_by), params
+
     async def get_personal_welfare(
         self,
-        session: postgres_session,
+        session: postgres_read_session,
+        primary_session: postgres_session,
+        response: Response,
         data: Annotated[WelfareDto, Query()],
         user: get_current_user_without_error,
     ):
-        filters = None
         if not hasattr(self.repository.model, data.order_by):
             raise HTTPException(status_code=404, detail="Order Column name was Not found")
 
-        if user:
-            user_data = await self.user_data_repository.get_user_data(session, sub=user.sub)
+        # 방금 저장한 UserData 가 replica 에 아직 반영되지 않았을 수 있으므로 primary 에서 읽습니다.
+        user_data = await self.user_data_repository.get_user_data(primary_session, sub=user.sub) if user else None
+        shape, params = self._get_shape(user, user_data, data)
 
+        def filters():
+            filters = None
             if user_data:
                 or_conditions = [
                     c
@@ -208,47 +272,78 @@ class GovWelfareService:
 
                 filters = and_(or_(*or_conditions), *and_conditions) if or_conditions else and_(*and_conditions)
 
-        if data.tag:
-            if filters:
-                filters = and_(filters, self.repository.model.support_type.contains(data.tag))
-            else:
-                filters = [self.repository.model.support_type.contains(data.tag)]
-
-        result = await self.repository.get_page(
-            session,
-            data.page,
-            data.size,
-            filters,
-            [
-                self.repository.model.id,
-                self.repository.model.views,
-                self.repository.model.service_id,
-                self.repository.model.service_name,
-                self.repository.model.service_summary,
-                self.repository.model.service_category,
-                self.repository.model.service_conditions,
-                self.repository.model.service_description,
-                self.repository.model.apply_period,
-                self.repository.model.apply_url,
-                self.repository.model.document,
-                self.repository.model.receiving_agency,
-                self.repository.model.offc_name,
-                self.repository.model.contact,
-                self.repository.model.support_details,
-            ],
-            [desc(getattr(self.repository.model, data.order_by))],
-        )
+            if data.tag:
+                tag = self.repository.model.support_type.contains(bindparam("tag", data.tag))
+                filters = tag if filters is None else and_(filters, tag)
+            return filters
+
+        order_column = getattr(self.repository.model, data.order_by)
+        columns = [
+            self.repository.model.id,
+            self.repository.model.views,
+            self.repository.model.service_id,
+            self.repository.model.service_name,
+            self.repository.model.service_summary,
+            self.repository.model.service_category,
+            self.repository.model.service_conditions,
+            self.repository.model.service_description,
+            self.repository.model.apply_period,
+            self.repository.model.apply_url,
+            self.repository.model.document,
+            self.repository.model.receiving_agency,
+            self.repository.model.offc_name,
+            self.repository.model.contact,
+            self.repository.model.support_details,
+        ]
+        if all(order_column is not column for column in columns):
+            columns.append(order_column)
+
+        if data.cursor is None:
+            result = await self.repository.get_page(
+                session,
+                data.page,
+                data.size,
+                filters,
+                columns,
+                [desc(order_column), desc(self.repository.model.id)],
+                shape=shape,
+                params=params,
+            )
+        else:
+            try:
+                result = await self.repository.get_cursor_page(
+                    session,
+                    data.size,
+                    filters,
+                    order_column,
+                    data.cursor,
+                    columns=columns,
+                    shape=shape,
+                    params=params,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
 
-        return result.mappings().all()
+        rows = result.mappings().all()
+        if next_cursor := self.repository.get_next_cursor(rows, order_column, data.size):
+            response.headers["X-Next-Cursor"] = next_cursor
+        return rows
 
     async def get_welfare(
         self,
-        session: postgres_session,
+        session: postgres_read_session,
         id: Annotated[str, Query()],
     ):
         result = await self.repository.get(session, [self.repository.model.service_id == id])
         return result.mappings().first()
 
-    async def get_welfare_id(self, session: postgres_session):
-        result = await self.repository.get(session, filters=[], columns=[self.repository.model.service_id])
-        return result.mappings().all()
+    async def get_welfare_id(self, format: Annotated[StreamFormat, Query()] = "json"):
+        async def partitions():
+            # 응답을 보내는 동안 커서가 열려 있어야 하므로 요청 session 대신 별도의 session 을 사용합니다.
+            async with PostgresRead.session_factory() as session:
+                async for rows in self.repository.stream(
+                    session, filters=None, columns=[self.repository.model.service_id], yield_per=5000
+                ):
+                    yield rows
+
+        return stream_response(partitions(), format, filename="welfare_id")
@@ -13,6 +13,12 @@ class DataBaseConfig(BaseModel):
     password: Annotated[str, Field(default="", serialization_alias="password")]
 
 
+class ReplicaConfig(BaseModel):
+    hosts: list[DataBaseConfig] = Field(default_factory=list)
+    max_lag: Annotated[float, Field(default=5.0)]
+    health_check_interval: Annotated[float, Field(default=10.0)]
+
+
 class JWT(BaseModel):
     algorithm: Annotated[str, Field(default="ES384")]
     access_token_expire_time: Annotated[int, Field(default=3600)]
@@ -61,6 +67,7 @@ class NATS(BaseModel):
 
 class ApiAdapter(BaseModel):
     key: str
+    refresh_interval: Annotated[int, Field(default=86400)]
 
 
 class Settings(BaseSettings):
@@ -69,6 +76,7 @@ class Settings(BaseSettings):
     debug: Annotated[bool, Field(default=False)]
     base_url: Annotated[str, Field(default="http://localhost:8000")]
     secret_key: Annotated[str, Field(default="YtGHVqSAzFyaHk2OV5XQg3")]
+    http2: Annotated[bool, Field(default=False)]
 
     cors_allow_origin: list[str] = Field(default_factory=list, frozen=True)
     allowed_hosts: list[str] = Field(default_factory=list, frozen=True)
@@ -79,6 +87,7 @@ class Settings(BaseSettings):
 
     jwt: Annotated[JWT, Field(default_factory=JWT)]
     postgres: DataBaseConfig
+    postgres_replica: ReplicaConfig = Field(default_factory=ReplicaConfig)
     redis: DataBaseConfig
     nats: NATS = Field(default_factory=NATS)
 
@@ -94,6 +103,13 @@ class Settings(BaseSettings):
     def postgres_dsn(self) -> PostgresDsn:
         return PostgresDsn.build(scheme="postgresql+asyncpg", **self.postgres.model_dump(by_alias=True))
 
+    @property
+    def postgres_replica_dsns(self) -> list[PostgresDsn]:
+        return [
+            PostgresDsn.build(scheme="postgresql+asyncpg", **host.model_dump(by_alias=True))
+            for host in self.postgres_replica.hosts
+        ]
+
     @property
     def sync_postgres_dsn(self) -> PostgresDsn:
         return PostgresDsn.build(scheme="postgresql+psycopg", **self.postgres.model_dump(by_alias=True))
@@ -8,13 +8,21 @@ from webtool.cache import RedisCache
 from webtool.db import AsyncDB, SyncDB
 
 from src.core.config import settings
+from src.core.utils.db_router import ReplicaRouter
 
 Postgres = AsyncDB(settings.postgres_dsn.unicode_string())
 Postgres_sync = SyncDB(settings.sync_postgres_dsn.unicode_string())
 Redis = RedisCache(settings.redis_dsn.unicode_string())
 Sqlite = SyncDB("sqlite:///:memory:")
+PostgresRead = ReplicaRouter(
+    Postgres,
+    [AsyncDB(dsn.unicode_string()) for dsn in settings.postgres_replica_dsns],
+    max_lag=settings.postgres_replica.max_lag,
+    health_check_interval=settings.postgres_replica.health_check_interval,
+)
 
 postgres_session = Annotated[AsyncSession, Depends(Postgres)]
+postgres_read_session = Annotated[AsyncSession, Depends(PostgresRead)]
 sqlite_session = Annotated[Session, Depends(Sqlite)]
 
 
@@ -1,3 +1,7 @@
 from nats import NATS
 
+from src.core.config import settings
+from src.core.utils.http_client import HttpClientRegistry
+
 nc = NATS()
+http_clients = HttpClientRegistry(http2=settings.http2)
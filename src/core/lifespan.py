@@ -1,17 +1,17 @@
 from contextlib import asynccontextmanager
 
-import httpx
 from fastapi import FastAPI
 
 from src.app.open_api.api.dependencies import (
-    fiscal_data_manager,
-    gov24_service_conditions_manager,
-    gov24_service_detail_manager,
-    gov24_service_list_manager,
+    data_managers,
+    data_refresh_worker,
+    default_callback_executor,
+    default_data_lock,
+    default_data_saver,
 )
 from src.core.config import settings
-from src.core.dependencies.db import Postgres, Redis, create_postgis_extension
-from src.core.dependencies.infra import nc
+from src.core.dependencies.db import Postgres, PostgresRead, Redis, create_postgis_extension
+from src.core.dependencies.infra import http_clients, nc
 
 
 @asynccontextmanager
@@ -19,17 +19,27 @@ async def lifespan(app: FastAPI):
     # app start
     print("Application Started")
     await nc.connect(servers=settings.nats.server, name=settings.nats.name)
+    await default_data_saver.subscribe()
     await create_postgis_extension()
-    await fiscal_data_manager.init()
-    await gov24_service_conditions_manager.init()
-    await gov24_service_detail_manager.init()
-    await gov24_service_list_manager.init()
-    app.requests_client = httpx.AsyncClient()
+    await PostgresRead.start()
 
-    yield
+    # only the worker holding the leader lock runs the ingest-build-save pipeline
+    async with default_data_lock.hold("leader") as is_leader:
+        if is_leader:
+            changed = [manager for manager in data_managers if await manager.init(notify=False)]
+            await data_refresh_worker.notify(*changed)
+            data_refresh_worker.start()
+        else:
+            print("🔹Open data is managed by the leader worker, skipping the operation.")
+
+        yield
+
+        await data_refresh_worker.stop()
 
     # app shutdown
+    default_callback_executor.shutdown()
+    await PostgresRead.aclose()
     await Postgres.aclose()
     await Redis.aclose()
-    await app.requests_client.aclose()
+    await http_clients.aclose()
     print("Application Stopped")
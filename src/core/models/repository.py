@@ -1,6 +1,29 @@
+import base64
+import json
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Iterator
+from datetime import date, datetime, time
+from itertools import batched, chain
 from typing import Any, Sequence, TypeVar, cast
 
-from sqlalchemy import Result, SQLColumnExpression, delete, insert, select, update
+from sqlalchemy import (
+    Integer,
+    Result,
+    RowMapping,
+    SQLColumnExpression,
+    and_,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.sql.base import ExecutableOption
@@ -10,14 +33,268 @@ from sqlalchemy.sql.selectable import Select
 T = TypeVar("T", bound=DeclarativeBase)
 _P = Result[tuple[Any]]
 _IP = Result[tuple[T]]
+_F = Sequence | ColumnElement | Callable[[], Sequence | ColumnElement | None] | None
+
+
+def _encode_default(value: Any) -> str:
+    if isinstance(value, date | time):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 기준 값들을 cursor 문자열로 변환합니다. 날짜와 시간은 ISO 8601 문자열로 저장합니다.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, default=_encode_default).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    encode_cursor 로 만든 cursor 문자열을 정렬 기준 값들로 되돌립니다.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
 
 
 class BaseRepository[T]:
     model: type[T]
     session: type[Session]
+    statement_cache_size: int = 256
+    bind_parameter_limit: int = 32767
 
     def __init__(self, model: type[T]):
         self.model = model
+        self._statements: dict[Hashable, Select] = {}
+
+    def get_statement(self, shape: Hashable, factory: Callable[[], Select]) -> Select:
+        """
+        같은 모양의 쿼리는 처음 한 번만 만들어 두고 재사용합니다.
+        같은 Select 객체를 다시 실행하면 SQLAlchemy 는 memoize 된 cache key 로 컴파일 캐시를 바로 찾으므로,
+        값은 bindparam 으로 두고 실행할 때 params 로 넘겨야 합니다.
+
+        Args:
+            shape (Hashable): 쿼리 모양을 구분하는 키. 모양을 바꾸는 모든 조건을 포함해야 합니다.
+            factory (Callable): 캐시에 없을 때 쿼리를 만드는 함수
+        """
+        stmt = self._statements.get(shape)
+        if stmt is None:
+            if len(self._statements) >= self.statement_cache_size:
+                self._statements.clear()
+            stmt = self._statements[shape] = factory()
+        return stmt
+
+    @staticmethod
+    def _build(
+        stmt: Select,
+        filters: Sequence | ColumnElement | None,
+        columns: Sequence[SQLColumnExpression] | None = None,
+        orderby: Sequence[ColumnElement] | None = None,
+        options: Sequence[ExecutableOption] = None,
+    ) -> Select:
+        if isinstance(filters, ColumnElement):
+            filters = [filters]
+        if filters:
+            stmt = stmt.where(*filters)
+        if orderby:
+            stmt = stmt.order_by(*orderby)
+        if options:
+            stmt = stmt.options(*options)
+        if columns:
+            stmt = stmt.with_only_columns(*columns)
+        return stmt
+
+    def _get_cursor_values(self, column: Any, cursor: str | None) -> tuple[Any, Any] | None:
+        if cursor is None:
+            return None
+
+        values = decode_cursor(cursor)
+        if len(values) != 3 or values[0] != column.key:
+            raise ValueError("Invalid cursor")
+        return self._parse_cursor_value(column, values[1]), self._parse_cursor_value(self.model.id, values[2])
+
+    @staticmethod
+    def _parse_cursor_value(column: Any, value: Any) -> Any:
+        """
+        JSON 으로 저장된 cursor 값을 컬럼의 python 타입으로 되돌립니다.
+        """
+        if value is None:
+            return None
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        if isinstance(value, python_type):
+            return value
+
+        try:
+            if python_type in (datetime, date, time):
+                return python_type.fromisoformat(value)
+            return python_type(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    def _seek(
+        self,
+        column: Any,
+        values: tuple[Any, Any] | None,
+        descending: bool,
+        bind: bool = False,
+    ) -> tuple[list[ColumnElement], list[ColumnElement]]:
+        """
+        (column, id) 순서로 정렬했을 때 cursor 다음 행부터 가져오는 조건과 정렬을 만듭니다.
+        Postgres 의 기본 NULL 정렬 (DESC 는 NULLS FIRST, ASC 는 NULLS LAST) 을 따릅니다.
+        bind 가 True 라면 cursor 값을 _cursor_value, _cursor_id bindparam 으로 둡니다.
+        """
+        if not hasattr(self.model, "id"):
+            raise AttributeError("Model does not have an 'id' attribute")
+
+        order = desc if descending else asc
+        orderby = [order(column), order(self.model.id)]
+        if values is None:
+            return [], orderby
+
+        value, last_id = values
+        if bind:
+            last_id = bindparam("_cursor_id", last_id, type_=self.model.id.type)
+            if value is not None:
+                value = bindparam("_cursor_value", value, type_=column.type)
+        else:
+            last_id = literal(last_id, self.model.id.type)
+            if value is not None:
+                value = literal(value, column.type)
+
+        if value is None:
+            after_id = self.model.id < last_id if descending else self.model.id > last_id
+            seek = and_(column.is_(None), after_id)
+            if descending:
+                seek = or_(seek, column.is_not(None))
+        elif descending:
+            seek = tuple_(column, self.model.id) < tuple_(value, last_id)
+        else:
+            seek = or_(tuple_(column, self.model.id) > tuple_(value, last_id), column.is_(None))
+
+        return [seek], orderby
+
+    def _page_statement(
+        self,
+        page: int,
+        size: int,
+        filters: _F,
+        columns: Sequence[SQLColumnExpression] | None,
+        orderby: Sequence[ColumnElement] | None,
+        options: Sequence[ExecutableOption],
+        shape: Hashable | None,
+    ) -> tuple[Select, dict[str, Any]]:
+        if shape is None:
+            stmt = select(self.model.__table__).fetch(size).offset(page * size)
+            return self._build(stmt, self._resolve(filters), columns, orderby, options), {}
+
+        def factory() -> Select:
+            stmt = select(self.model.__table__)
+            stmt = stmt.fetch(bindparam("_size", type_=Integer)).offset(bindparam("_offset", type_=Integer))
+            return self._build(stmt, self._resolve(filters), columns, orderby, options)
+
+        return self.get_statement(("page", shape), factory), {"_size": size, "_offset": page * size}
+
+    def _cursor_statement(
+        self,
+        size: int,
+        filters: _F,
+        order_column: Any,
+        cursor: str | None,
+        descending: bool,
+        columns: Sequence[SQLColumnExpression] | None,
+        options: Sequence[ExecutableOption],
+        shape: Hashable | None,
+    ) -> tuple[Select, dict[str, Any]]:
+        values = self._get_cursor_values(order_column, cursor)
+        if columns:
+            columns = [*columns, *(c for c in (order_column, self.model.id) if all(c is not col for col in columns))]
+
+        def factory() -> Select:
+            seek, orderby = self._seek(order_column, values, descending, bind=shape is not None)
+            stmt = select(self.model.__table__)
+            stmt = stmt.limit(size if shape is None else bindparam("_size", type_=Integer))
+            return self._build(stmt, self._with_filters(self._resolve(filters), seek), columns, orderby, options)
+
+        if shape is None:
+            return factory(), {}
+
+        params = {"_size": size}
+        if values is not None:
+            params["_cursor_id"] = values[1]
+            if values[0] is not None:
+                params["_cursor_value"] = values[0]
+
+        key = ("cursor", shape, order_column.key, descending, None if values is None else values[0] is None)
+        return self.get_statement(key, factory), params
+
+    def _batches(self, rows: Iterable[dict[str, Any]], batch_size: int | None = None) -> Iterator[list[dict[str, Any]]]:
+        """
+        한 번에 보내는 bind parameter 수가 bind_parameter_limit 를 넘지 않도록 행을 나눕니다.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return
+
+        size = batch_size or max(1, self.bind_parameter_limit // max(1, len(first)))
+        for batch in batched(chain([first], rows), size, strict=False):
+            yield list(batch)
+
+    def _upsert_statement(
+        self,
+        index_elements: Sequence[str],
+        update_columns: Sequence[str] | None,
+        row: dict[str, Any],
+    ) -> Insert:
+        """
+        index_elements 가 충돌하면 update_columns 를 새 값으로 바꾸는 INSERT ... ON CONFLICT 문을 만듭니다.
+        update_columns 가 없다면 index_elements 를 제외한 행의 모든 키를 갱신합니다.
+        """
+        if update_columns is None:
+            update_columns = [k for k in row if k not in index_elements]
+        index_elements, update_columns = tuple(index_elements), tuple(update_columns)
+
+        def factory() -> Insert:
+            stmt = pg_insert(self.model)
+            if not update_columns:
+                return stmt.on_conflict_do_nothing(index_elements=index_elements)
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={c: stmt.excluded[c] for c in update_columns},
+            )
+
+        return self.get_statement(("upsert", index_elements, update_columns), factory)
+
+    @staticmethod
+    def _resolve(filters: _F) -> Sequence | ColumnElement | None:
+        return filters() if callable(filters) else filters
+
+    @staticmethod
+    def _with_filters(filters: Sequence | ColumnElement | None, extra: list[ColumnElement]) -> list:
+        if filters is None:
+            return extra
+        if isinstance(filters, ColumnElement):
+            return [filters, *extra]
+        return [*filters, *extra]
+
+    @staticmethod
+    def get_next_cursor(rows: Sequence[Any], column: Any, size: int) -> str | None:
+        """
+        가져온 행이 size 만큼 채워져 있다면 마지막 행으로 다음 cursor 를 만듭니다.
+        """
+        if len(rows) < size:
+            return None
+        last = rows[-1]
+        return encode_cursor(column.key, last[column.key], last["id"])
 
     def _dict_to_model(self, kwargs: Any) -> Any:
         return {
@@ -35,9 +312,36 @@ class BaseCreateRepository[T](BaseRepository[T]):
 
         return entity
 
-    def bulk_create(self, session: Session, kwargs: Sequence[dict[str, Any]]) -> None:
-        stmt = insert(self.model).values(kwargs)
-        session.execute(stmt)
+    def bulk_create(
+        self,
+        session: Session,
+        kwargs: Iterable[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> None:
+        for batch in self._batches(kwargs, batch_size):
+            session.execute(insert(self.model), batch)
+        session.commit()
+
+    def upsert(
+        self,
+        session: Session,
+        kwargs: Iterable[dict[str, Any]],
+        index_elements: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        행을 batch 로 나누어 INSERT ... ON CONFLICT DO UPDATE 를 executemany 로 실행합니다.
+
+        Args:
+            kwargs (Iterable): 넣을 행
+            index_elements (Sequence): 충돌을 판단할 unique 컬럼
+            update_columns (Sequence): 충돌할 때 갱신할 컬럼, 없다면 index_elements 를 제외한 모든 키
+            batch_size (int): 한 번에 보낼 행 수, 없다면 bind_parameter_limit 로 계산합니다.
+        """
+        for batch in self._batches(kwargs, batch_size):
+            stmt = self._upsert_statement(index_elements, update_columns, batch[0])
+            session.execute(stmt, batch)
         session.commit()
 
 
@@ -53,18 +357,32 @@ class BaseReadRepository[T](BaseRepository[T]):
     ) -> _P:
         if stmt is None:
             stmt = select(self.model.__table__)
-        if filters:
-            stmt = stmt.where(*filters)
-        if orderby:
-            stmt = stmt.order_by(*orderby)
-        if options:
-            stmt = stmt.options(*options)
-        if columns:
-            stmt = stmt.with_only_columns(*columns)
-        result = session.execute(stmt)
+        result = session.execute(self._build(stmt, filters, columns, orderby, options))
 
         return result
 
+    def stream(
+        self,
+        session: Session,
+        filters: Sequence | ColumnElement | None,
+        columns: Sequence[SQLColumnExpression] | None = None,
+        orderby: Sequence[ColumnElement] | None = None,
+        options: Sequence[ExecutableOption] = None,
+        stmt: Select | None = None,
+        yield_per: int = 1000,
+    ) -> Iterator[Sequence[RowMapping]]:
+        """
+        서버 측 커서로 결과를 yield_per 행씩 나누어 가져옵니다.
+        """
+        if stmt is None:
+            stmt = select(self.model.__table__)
+        stmt = self._build(stmt, filters, columns, orderby, options).execution_options(yield_per=yield_per)
+        result = session.execute(stmt)
+        try:
+            yield from result.mappings().partitions()
+        finally:
+            result.close()
+
     def get_by_id(
         self,
         session: Session,
@@ -91,19 +409,33 @@ class BaseReadRepository[T](BaseRepository[T]):
         session: Session,
         page: int,
         size: int,
-        filters: Sequence,
+        filters: _F,
         columns: Sequence[SQLColumnExpression] | None = None,
         orderby: Sequence[ColumnElement] | None = None,
         options: Sequence[ExecutableOption] = None,
+        shape: Hashable | None = None,
+        params: dict[str, Any] | None = None,
     ) -> _P:
-        return self.get(
-            session=session,
-            filters=filters,
-            columns=columns,
-            orderby=orderby,
-            options=options,
-            stmt=select(self.model.__table__).fetch(size).offset(page * size),
+        stmt, page_params = self._page_statement(page, size, filters, columns, orderby, options, shape)
+        return session.execute(stmt, {**(params or {}), **page_params})
+
+    def get_cursor_page(
+        self,
+        session: Session,
+        size: int,
+        filters: _F,
+        order_column: Any,
+        cursor: str | None = None,
+        descending: bool = True,
+        columns: Sequence[SQLColumnExpression] | None = None,
+        options: Sequence[ExecutableOption] = None,
+        shape: Hashable | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> _P:
+        stmt, page_params = self._cursor_statement(
+            size, filters, order_column, cursor, descending, columns, options, shape
         )
+        return session.execute(stmt, {**(params or {}), **page_params})
 
     def get_instance(
         self,
@@ -134,6 +466,19 @@ class BaseUpdateRepository[T](BaseRepository[T]):
         session.execute(stmt)
         session.commit()
 
+    def bulk_update(
+        self,
+        session: Session,
+        kwargs: Iterable[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        id 를 포함한 행들을 batch 로 나누어 UPDATE ... WHERE id = ? 를 executemany 로 실행합니다.
+        """
+        for batch in self._batches(kwargs, batch_size):
+            session.execute(update(self.model), batch)
+        session.commit()
+
 
 class BaseDeleteRepository[T](BaseRepository[T]):
     def _delete(self, session: Session, id: int | str) -> None:
@@ -168,9 +513,36 @@ class ABaseCreateRepository[T](ABaseRepository[T]):
 
         return entity
 
-    async def bulk_create(self, session: AsyncSession, kwargs: Sequence[dict[str, Any]]) -> None:
-        stmt = insert(self.model).values(kwargs)
-        await session.execute(stmt)
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        kwargs: Iterable[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> None:
+        for batch in self._batches(kwargs, batch_size):
+            await session.execute(insert(self.model), batch)
+        await session.commit()
+
+    async def upsert(
+        self,
+        session: AsyncSession,
+        kwargs: Iterable[dict[str, Any]],
+        index_elements: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        행을 batch 로 나누어 INSERT ... ON CONFLICT DO UPDATE 를 executemany 로 실행합니다.
+
+        Args:
+            kwargs (Iterable): 넣을 행
+            index_elements (Sequence): 충돌을 판단할 unique 컬럼
+            update_columns (Sequence): 충돌할 때 갱신할 컬럼, 없다면 index_elements 를 제외한 모든 키
+            batch_size (int): 한 번에 보낼 행 수, 없다면 bind_parameter_limit 로 계산합니다.
+        """
+        for batch in self._batches(kwargs, batch_size):
+            stmt = self._upsert_statement(index_elements, update_columns, batch[0])
+            await session.execute(stmt, batch)
         await session.commit()
 
 
@@ -186,18 +558,34 @@ class ABaseReadRepository[T](ABaseRepository[T]):
     ) -> _P:
         if stmt is None:
             stmt = select(self.model.__table__)
-        if filters:
-            stmt = stmt.where(*filters)
-        if orderby:
-            stmt = stmt.order_by(*orderby)
-        if options:
-            stmt = stmt.options(*options)
-        if columns:
-            stmt = stmt.with_only_columns(*columns)
-        result = await session.execute(stmt)
+        result = await session.execute(self._build(stmt, filters, columns, orderby, options))
 
         return result
 
+    async def stream(
+        self,
+        session: AsyncSession,
+        filters: Sequence | ColumnElement | None,
+        columns: Sequence[SQLColumnExpression] | None = None,
+        orderby: Sequence[ColumnElement] | None = None,
+        options: Sequence[ExecutableOption] = None,
+        stmt: Select | None = None,
+        yield_per: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        AsyncSession.stream 으로 서버 측 커서를 열고 결과를 yield_per 행씩 나누어 가져옵니다.
+        session 은 iterator 를 끝까지 소비할 때까지 열려 있어야 합니다.
+        """
+        if stmt is None:
+            stmt = select(self.model.__table__)
+        stmt = self._build(stmt, filters, columns, orderby, options).execution_options(yield_per=yield_per)
+        result = await session.stream(stmt)
+        try:
+            async for rows in result.mappings().partitions():
+                yield rows
+        finally:
+            await result.close()
+
     async def get_by_id(
         self,
         session: AsyncSession,
@@ -224,19 +612,33 @@ class ABaseReadRepository[T](ABaseRepository[T]):
         session: AsyncSession,
         page: int,
         size: int,
-        filters: Sequence,
+        filters: _F,
         columns: Sequence[SQLColumnExpression] | None = None,
         orderby: Sequence[ColumnElement] | None = None,
         options: Sequence[ExecutableOption] = None,
+        shape: Hashable | None = None,
+        params: dict[str, Any] | None = None,
     ) -> _P:
-        return await self.get(
-            session=session,
-            filters=filters,
-            columns=columns,
-            orderby=orderby,
-            options=options,
-            stmt=select(self.model.__table__).fetch(size).offset(page * size),
+        stmt, page_params = self._page_statement(page, size, filters, columns, orderby, options, shape)
+        return await session.execute(stmt, {**(params or {}), **page_params})
+
+    async def get_cursor_page(
+        self,
+        session: AsyncSession,
+        size: int,
+        filters: _F,
+        order_column: Any,
+        cursor: str | None = None,
+        descending: bool = True,
+        columns: Sequence[SQLColumnExpression] | None = None,
+        options: Sequence[ExecutableOption] = None,
+        shape: Hashable | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> _P:
+        stmt, page_params = self._cursor_statement(
+            size, filters, order_column, cursor, descending, columns, options, shape
         )
+        return await session.execute(stmt, {**(params or {}), **page_params})
 
     async def get_instance(
         self,
@@ -267,6 +669,19 @@ class ABaseUpdateRepository[T](ABaseRepository[T]):
         await session.execute(stmt)
         await session.commit()
 
+    async def bulk_update(
+        self,
+        session: AsyncSession,
+        kwargs: Iterable[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        id 를 포함한 행들을 batch 로 나누어 UPDATE ... WHERE id = ? 를 executemany 로 실행합니다.
+        """
+        for batch in self._batches(kwargs, batch_size):
+            await session.execute(update(self.model), batch)
+        await session.commit()
+
 
 class ABaseDeleteRepository[T](ABaseRepository[T]):
     async def _delete(self, session: AsyncSession, id: int | str) -> None:
@@ -0,0 +1,116 @@
+import asyncio
+import itertools
+from collections.abc import AsyncGenerator, Sequence
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from webtool.db import AsyncDB
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 session 을 replica 로 보내는 클래스
+
+    health_check_interval 마다 replica 의 연결과 복제 지연을 확인하고,
+    응답하지 않거나 지연이 max_lag 를 넘는 replica 는 제외합니다.
+    사용할 수 있는 replica 가 없다면 primary 를 사용합니다.
+    복제 중이 아닌 서버 (pg_is_in_recovery 가 false) 는 지연이 없는 것으로 봅니다.
+    """
+
+    _LAG_QUERY = text(
+        """
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+        """
+    )
+
+    def __init__(
+        self,
+        primary: AsyncDB,
+        replicas: Sequence[AsyncDB] = (),
+        max_lag: float = 5.0,
+        health_check_interval: float = 10.0,
+        health_check_timeout: float = 2.0,
+    ):
+        """
+        Args:
+            primary (AsyncDB): 쓰기와 fallback 에 사용할 DB
+            replicas (Sequence): 읽기에 사용할 replica DB
+            max_lag (float): 허용할 최대 복제 지연 (초)
+            health_check_interval (float): 상태를 확인하는 주기 (초)
+            health_check_timeout (float): 상태 확인 timeout (초)
+        """
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.max_lag = max_lag
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.healthy: tuple[AsyncDB, ...] = ()
+        self._cycle = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    async def __call__(self) -> AsyncGenerator[AsyncSession]:
+        async with self.session_factory() as session:
+            try:
+                yield session
+            except exc.SQLAlchemyError as error:
+                await session.rollback()
+                raise error
+
+    def get_db(self) -> AsyncDB:
+        healthy = self.healthy
+        if not healthy:
+            return self.primary
+        return healthy[next(self._cycle) % len(healthy)]
+
+    def session_factory(self) -> AsyncSession:
+        return self.get_db().session_factory()
+
+    async def get_lag(self, db: AsyncDB) -> float | None:
+        """
+        replica 의 복제 지연 (초) 을 돌려줍니다. 연결할 수 없거나 지연을 알 수 없다면 None 을 돌려줍니다.
+        """
+        try:
+            async with asyncio.timeout(self.health_check_timeout):
+                async with db.engine.connect() as conn:
+                    lag = (await conn.execute(self._LAG_QUERY)).scalar()
+        except Exception:
+            return None
+        return None if lag is None else float(lag)
+
+    async def check(self):
+        lags = await asyncio.gather(*(self.get_lag(db) for db in self.replicas))
+        healthy = tuple(
+            db for db, lag in zip(self.replicas, lags, strict=True) if lag is not None and lag <= self.max_lag
+        )
+
+        for db, lag in zip(self.replicas, lags, strict=True):
+            if (db in healthy) != (db in self.healthy):
+                state = "restored" if db in healthy else f"excluded (lag: {lag})"
+                print(f"{'🔹' if db in healthy else '🔸'}Replica {db.engine.url.host}:{db.engine.url.port} {state}")
+        self.healthy = healthy
+
+    async def start(self):
+        if not self.replicas:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def aclose(self):
+        await self.stop()
+        for db in self.replicas:
+            await db.aclose()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check()
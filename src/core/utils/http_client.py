@@ -0,0 +1,57 @@
+from importlib.util import find_spec
+
+import httpx
+
+
+class HttpClientRegistry:
+    """
+    Base URL 마다 하나의 httpx.AsyncClient 를 만들어 공유하는 클래스
+
+    같은 호스트로 가는 요청이 연결을 재사용하므로 TLS handshake 와 연결 수립 비용이 한 번만 발생합니다.
+    클라이언트는 처음 요청할 때 만들어지며, lifespan 이 종료될 때 aclose 로 모두 닫습니다.
+    """
+
+    def __init__(
+        self,
+        http2: bool = False,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            http2 (bool): HTTP/2 사용 여부, h2 패키지가 설치되어 있지 않으면 무시됩니다.
+            max_connections (int): 호스트마다 최대 연결 수
+            max_keepalive_connections (int): 호스트마다 유지할 최대 연결 수
+            keepalive_expiry (float): 유휴 연결을 유지할 시간 (초)
+            timeout (float): 기본 timeout (초)
+        """
+        self.http2 = http2 and find_spec("h2") is not None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, base_url: str = "") -> httpx.AsyncClient:
+        client = self._clients.get(base_url)
+
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+            self._clients[base_url] = client
+
+        return client
+
+    async def aclose(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
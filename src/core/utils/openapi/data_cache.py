@@ -1,9 +1,19 @@
-import gzip
+import asyncio
+import hashlib
 import json
+import os
+import uuid
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
 
+from nats import NATS
 from webtool.cache import RedisCache
 
+from .data_codec import BaseDataCodec, JsonDataCodec
+
+_MANIFEST_PREFIX = b"chunked-manifest:"
+
 
 class BaseDataCache(ABC):
     """
@@ -18,7 +28,7 @@ class BaseDataCache(ABC):
     expire: int
 
     @abstractmethod
-    async def get_cache(self, key: str) -> dict | None:
+    async def get_cache(self, key: str) -> Any | None:
         """
         캐시로부터 데이터를 불러옵니다.
 
@@ -28,40 +38,262 @@ class BaseDataCache(ABC):
         pass
 
     @abstractmethod
-    async def set_cache(self, key: str, value: dict) -> None:
+    async def set_cache(self, key: str, value: Any) -> None:
         """
         캐시에 대이터를 저장합니다.
 
         Args:
             key (str): Cache Key
-            value (dict): Cache Value
+            value (Any): Cache Value
+        """
+        pass
+
+    @abstractmethod
+    async def delete_cache(self, *key: str) -> None:
+        """
+        캐시에서 데이터를 삭제합니다.
+
+        Args:
+            key (str): Cache Key
         """
         pass
 
 
 class RedisDataCache(BaseDataCache):
-    def __init__(self, cache: RedisCache, expire: int = 31536000, key_prefix: str = ""):
+    def __init__(
+        self,
+        cache: RedisCache,
+        expire: int = 31536000,
+        key_prefix: str = "",
+        codec: BaseDataCodec | None = None,
+        chunk_size: int | None = None,
+        chunk_batch_size: int = 16,
+    ):
+        """
+        Args:
+            cache (RedisCache): Redis 클라이언트
+            expire (int): 만료 (초)
+            key_prefix (str): 키 전치사
+            codec (BaseDataCodec): 직렬화 방식, 기본값은 gzip 으로 압축한 JSON 입니다.
+            chunk_size (int): 값이 이 크기 (bytes) 보다 크면 여러 키로 나누어 저장합니다. None 이면 나누지 않습니다.
+            chunk_batch_size (int): 한 번의 pipeline 혹은 MGET 으로 주고받을 chunk 수
+        """
         self.expire = expire
         self.key_prefix = key_prefix
         self.cache = cache
+        self.codec = codec or JsonDataCodec()
+        self.chunk_size = chunk_size
+        self.chunk_batch_size = chunk_batch_size
 
     def get_cache_key(self, key: str | None) -> str:
         return f"{self.key_prefix}{key if key else ''}"
 
-    async def get_cache(self, key: str) -> dict | None:
+    async def get_cache(self, key: str) -> Any | None:
         cache_key = self.get_cache_key(key)
 
         try:
             serialized_data = await self.cache.get(cache_key)
+            manifest = self._parse_manifest(serialized_data)
+            if manifest is not None:
+                serialized_data = await self._get_chunks(cache_key, manifest)
         except Exception:
             serialized_data = None
 
-        if serialized_data:
-            return json.loads(gzip.decompress(serialized_data))
-        return None
+        if not serialized_data:
+            return None
 
-    async def set_cache(self, key: str, value: dict) -> None:
+        try:
+            return self.codec.decode(serialized_data)
+        except Exception:
+            # 다른 codec 으로 저장된 캐시는 없는 것으로 취급합니다.
+            return None
+
+    async def set_cache(self, key: str, value: Any) -> None:
         cache_key = self.get_cache_key(key)
 
-        serialized_data = gzip.compress(json.dumps(value).encode())
-        await self.cache.set(cache_key, serialized_data, ex=self.expire)
+        serialized_data = self.codec.encode(value)
+        previous = self._parse_manifest(await self.cache.get(cache_key)) if self.chunk_size else None
+
+        if self.chunk_size and len(serialized_data) > self.chunk_size:
+            manifest = await self._set_chunks(cache_key, serialized_data)
+            await self.cache.set(cache_key, _MANIFEST_PREFIX + json.dumps(manifest).encode(), ex=self.expire)
+        else:
+            await self.cache.set(cache_key, serialized_data, ex=self.expire)
+
+        if previous is not None:
+            # 이전 chunk 를 읽고 있는 프로세스가 있을 수 있으므로 바로 지우지 않고 곧 만료되도록 합니다.
+            async with self.cache.cache.pipeline(transaction=False) as pipe:
+                for chunk_key in self._get_chunk_keys(cache_key, previous):
+                    pipe.expire(chunk_key, 60)
+                await pipe.execute()
+
+    async def delete_cache(self, *key: str) -> None:
+        cache_keys = [self.get_cache_key(k) for k in key]
+
+        if self.chunk_size:
+            manifests = await self.cache.cache.mget(cache_keys) if cache_keys else []
+            for cache_key, data in zip(cache_keys.copy(), manifests, strict=True):
+                manifest = self._parse_manifest(data)
+                if manifest is not None:
+                    cache_keys.extend(self._get_chunk_keys(cache_key, manifest))
+
+        for i in range(0, len(cache_keys), 1000):
+            await self.cache.cache.delete(*cache_keys[i : i + 1000])
+
+    @staticmethod
+    def _parse_manifest(data: bytes | None) -> dict | None:
+        if not data or not data.startswith(_MANIFEST_PREFIX):
+            return None
+        return json.loads(data[len(_MANIFEST_PREFIX) :])
+
+    @staticmethod
+    def _get_chunk_keys(cache_key: str, manifest: dict) -> list[str]:
+        return [f"{cache_key}:chunk:{manifest['version']}:{i}" for i in range(manifest["chunks"])]
+
+    async def _set_chunks(self, cache_key: str, data: bytes) -> dict:
+        chunks = [data[i : i + self.chunk_size] for i in range(0, len(data), self.chunk_size)]
+        manifest = {"version": uuid.uuid4().hex, "chunks": len(chunks), "size": len(data)}
+        chunk_keys = self._get_chunk_keys(cache_key, manifest)
+
+        for i in range(0, len(chunks), self.chunk_batch_size):
+            async with self.cache.cache.pipeline(transaction=False) as pipe:
+                for chunk_key, chunk in zip(
+                    chunk_keys[i : i + self.chunk_batch_size],
+                    chunks[i : i + self.chunk_batch_size],
+                    strict=True,
+                ):
+                    pipe.set(chunk_key, chunk, ex=self.expire)
+                await pipe.execute()
+
+        return manifest
+
+    async def _get_chunks(self, cache_key: str, manifest: dict) -> bytes | None:
+        chunk_keys = self._get_chunk_keys(cache_key, manifest)
+        batches = await asyncio.gather(
+            *(
+                self.cache.cache.mget(chunk_keys[i : i + self.chunk_batch_size])
+                for i in range(0, len(chunk_keys), self.chunk_batch_size)
+            )
+        )
+
+        chunks = [chunk for batch in batches for chunk in batch]
+        if any(chunk is None for chunk in chunks):
+            return None
+
+        data = b"".join(chunks)
+        return data if len(data) == manifest["size"] else None
+
+
+class LocalDataCache(BaseDataCache):
+    """
+    RedisDataCache 앞에 호스트 로컬 파일 (기본값은 /dev/shm) 캐시를 두는 클래스
+
+    값을 저장할 때마다 Redis 에 새 버전을 기록하고 같은 버전의 파일을 로컬에 남깁니다.
+    불러올 때는 Redis 에서 작은 버전 키만 읽고, 같은 버전의 로컬 파일이 있으면 Redis 의 데이터는 읽지 않습니다.
+    nc 를 지정하면 값이 바뀔 때 NATS 로 알려 다른 호스트의 오래된 로컬 파일을 지웁니다.
+    """
+
+    def __init__(
+        self,
+        cache: RedisDataCache,
+        directory: str | Path = "/dev/shm/open_api",
+        nc: NATS | None = None,
+        subject: str = "open_api.cache.invalidate",
+    ):
+        """
+        Args:
+            cache (RedisDataCache): 데이터를 저장할 Redis 캐시
+            directory (str | Path): 로컬 파일을 저장할 경로
+            nc (NATS): 무효화 메시지를 주고받을 NATS 클라이언트
+            subject (str): 무효화 메시지의 subject
+        """
+        self.cache = cache
+        self.expire = cache.expire
+        self.key_prefix = cache.key_prefix
+        self.directory = Path(directory)
+        self.nc = nc
+        self.subject = subject
+
+    def get_version_key(self, key: str) -> str:
+        return f"{self.cache.get_cache_key(key)}:version"
+
+    def get_local_path(self, key: str, version: str) -> Path:
+        digest = hashlib.sha1(self.cache.get_cache_key(key).encode()).hexdigest()
+        return self.directory / f"{digest}.{version}"
+
+    async def get_cache(self, key: str) -> Any | None:
+        try:
+            version = await self.cache.cache.get(self.get_version_key(key))
+        except Exception:
+            version = None
+
+        if version is None:
+            return await self.cache.get_cache(key)
+
+        version = version.decode() if isinstance(version, bytes) else version
+        path = self.get_local_path(key, version)
+
+        try:
+            return await asyncio.to_thread(lambda: self.cache.codec.decode(path.read_bytes()))
+        except Exception:
+            pass
+
+        value = await self.cache.get_cache(key)
+        if value is not None:
+            await asyncio.to_thread(self._write_local, key, version, value)
+        return value
+
+    async def set_cache(self, key: str, value: Any) -> None:
+        version = uuid.uuid4().hex
+
+        await self.cache.set_cache(key, value)
+        await self.cache.cache.set(self.get_version_key(key), version, ex=self.expire)
+        await asyncio.to_thread(self._write_local, key, version, value)
+        await self._publish(key, version)
+
+    async def delete_cache(self, *key: str) -> None:
+        await self.cache.delete_cache(*key)
+        await self.cache.cache.cache.delete(*(self.get_version_key(k) for k in key))
+
+        for k in key:
+            await asyncio.to_thread(self._remove_local, k)
+            await self._publish(k, None)
+
+    async def subscribe(self):
+        """
+        다른 프로세스가 값을 바꾸었을 때 오래된 로컬 파일을 지우도록 무효화 subject 를 구독합니다.
+        """
+        if self.nc is None:
+            return
+
+        async def callback(msg):
+            message = json.loads(msg.data)
+            await asyncio.to_thread(self._remove_local, message["key"], message["version"])
+
+        await self.nc.subscribe(self.subject, cb=callback)
+
+    async def _publish(self, key: str, version: str | None):
+        if self.nc is None or not self.nc.is_connected:
+            return
+        await self.nc.publish(self.subject, json.dumps({"key": key, "version": version}).encode())
+
+    def _write_local(self, key: str, version: str, value: Any):
+        path = self.get_local_path(key, version)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(self.cache.codec.encode(value))
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return
+
+        self._remove_local(key, version)
+
+    def _remove_local(self, key: str, keep: str | None = None):
+        prefix = self.get_local_path(key, "").name
+
+        for path in self.directory.glob(f"{prefix}*"):
+            if path.name != f"{prefix}{keep}":
+                path.unlink(missing_ok=True)
@@ -0,0 +1,90 @@
+import gzip
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+import polars as pl
+
+
+class BaseDataCodec(ABC):
+    """
+    캐시에 저장할 데이터를 bytes 로 변환하고 다시 복원하는 클래스
+    """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """
+        Args:
+            value (Any): 저장할 데이터
+
+        Returns:
+            직렬화된 데이터
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """
+        Args:
+            data (bytes): 직렬화된 데이터
+
+        Returns:
+            복원된 데이터
+        """
+        pass
+
+
+class JsonDataCodec(BaseDataCodec):
+    """
+    gzip 으로 압축한 JSON, DataFrame 은 행 단위 dict 의 list 로 저장합니다.
+    """
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, pl.DataFrame):
+            value = value.to_dicts()
+        return gzip.compress(json.dumps(value).encode())
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(gzip.decompress(data))
+
+
+class ArrowDataCodec(BaseDataCodec):
+    """
+    zstd 로 압축한 Arrow IPC, 스키마가 그대로 보존되며 JSON 파싱과 스키마 추론 없이 복원됩니다.
+    """
+
+    def __init__(self, compression: str = "zstd"):
+        self.compression = compression
+
+    def encode(self, value: Any) -> bytes:
+        if not isinstance(value, pl.DataFrame):
+            value = pl.DataFrame(value)
+
+        buffer = io.BytesIO()
+        value.write_ipc(buffer, compression=self.compression)
+        return buffer.getvalue()
+
+    def decode(self, data: bytes) -> pl.DataFrame:
+        return pl.read_ipc(io.BytesIO(data), memory_map=False)
+
+
+class ParquetDataCodec(BaseDataCodec):
+    """
+    zstd 로 압축한 Parquet, Arrow IPC 보다 작지만 복원할 때 디코딩 비용이 있습니다.
+    """
+
+    def __init__(self, compression: str = "zstd", compression_level: int | None = None):
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def encode(self, value: Any) -> bytes:
+        if not isinstance(value, pl.DataFrame):
+            value = pl.DataFrame(value)
+
+        buffer = io.BytesIO()
+        value.write_parquet(buffer, compression=self.compression, compression_level=self.compression_level)
+        return buffer.getvalue()
+
+    def decode(self, data: bytes) -> pl.DataFrame:
+        return pl.read_parquet(io.BytesIO(data))
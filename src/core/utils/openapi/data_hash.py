@@ -0,0 +1,112 @@
+import hashlib
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+_P = np.uint64(0x100000001B3)
+_K = np.uint64(0x9E3779B97F4A7C15)
+_NULL = np.uint64(0x5BD1E9955BD1E995)
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer"""
+    h = h ^ (h >> np.uint64(30))
+    h = h * np.uint64(0xBF58476D1CE4E5B9)
+    h = h ^ (h >> np.uint64(27))
+    h = h * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def _hash_bytes(s: pl.Series) -> np.ndarray:
+    """
+    Arrow 버퍼의 offsets 와 data 를 그대로 읽어 값마다 다항식 해시를 계산합니다.
+    파이썬 루프 없이 numpy 연산만 사용하며, 결과는 프로세스나 Polars 버전에 관계없이 같습니다.
+    """
+    array = pc.cast(s.cast(pl.Binary).to_arrow(), pa.large_binary())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+
+    _, offsets_buffer, data_buffer = array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[array.offset : array.offset + len(array) + 1]
+    start, end = offsets[0], offsets[-1]
+    lengths = np.diff(offsets).astype(np.uint64)
+
+    if end == start:
+        return _mix(lengths)
+
+    data = np.frombuffer(data_buffer, dtype=np.uint8)[start:end].astype(np.uint64) + np.uint64(1)
+    powers = np.cumprod(np.full(int(lengths.max()), _P, dtype=np.uint64))
+    powers = np.concatenate(([np.uint64(1)], powers[:-1]))
+    exponent = np.repeat(offsets[1:] - start, lengths.astype(np.int64)) - 1 - np.arange(end - start)
+
+    cumsum = np.concatenate(([np.uint64(0)], np.cumsum(data * powers[exponent], dtype=np.uint64)))
+    return _mix((cumsum[offsets[1:] - start] - cumsum[offsets[:-1] - start]) ^ (lengths * _K))
+
+
+def _hash_series(s: pl.Series) -> np.ndarray:
+    dtype = s.dtype
+
+    if dtype == pl.Boolean:
+        values = s.cast(pl.UInt8).fill_null(0).cast(pl.UInt64).to_numpy()
+    elif dtype.is_float():
+        values = s.cast(pl.Float64).fill_null(0).to_numpy().view(np.uint64)
+    elif dtype.is_integer() or dtype.is_temporal():
+        physical = s.to_physical()
+        physical = physical.cast(pl.UInt64 if physical.dtype.is_unsigned_integer() else pl.Int64)
+        values = physical.fill_null(0).to_numpy().view(np.uint64)
+    elif dtype in (pl.String, pl.Binary, pl.Categorical, pl.Enum) or isinstance(dtype, pl.Decimal):
+        values = _hash_bytes(s if dtype == pl.Binary else s.cast(pl.String))
+    else:
+        values = _hash_bytes(pl.Series([None if v is None else str(v) for v in s.to_list()], dtype=pl.String))
+
+    h = _mix(values)
+    if s.has_nulls():
+        h[s.is_null().to_numpy()] = _NULL
+    return h
+
+
+def _hash_rows(df: pl.DataFrame) -> np.ndarray:
+    h = np.full(df.height, _K, dtype=np.uint64)
+    for column in sorted(df.columns):
+        h = _mix(h * _P ^ _hash_series(df[column]))
+    return h
+
+
+def hash_rows(df: pl.DataFrame, chunk_size: int = 100000) -> pl.Series:
+    """
+    행마다 안정적인 64bit 해시를 계산합니다.
+    pl.DataFrame.hash_rows 와 달리 Polars 버전이 바뀌어도 같은 값을 돌려줍니다.
+
+    Args:
+        df (pl.DataFrame): 해시할 DataFrame
+        chunk_size (int): 한 번에 해시할 행 수
+    """
+    chunks = [_hash_rows(frame) for frame in df.iter_slices(chunk_size)]
+    return pl.Series("hash", np.concatenate(chunks) if chunks else [], dtype=pl.UInt64)
+
+
+def hash_df(df: pl.DataFrame, chunk_size: int = 100000) -> str:
+    """
+    행 순서에 관계없는 DataFrame 의 해시를 계산합니다.
+    행 해시를 chunk 단위로 계산해 합과 XOR 로 접으므로 메모리 사용량이 chunk 크기로 제한됩니다.
+
+    Args:
+        df (pl.DataFrame): 해시할 DataFrame
+        chunk_size (int): 한 번에 해시할 행 수
+    """
+    total_sum, total_xor = np.uint64(0), np.uint64(0)
+
+    for frame in df.iter_slices(chunk_size):
+        h = _hash_rows(frame)
+        total_sum = np.add(total_sum, h.sum(dtype=np.uint64), dtype=np.uint64)
+        total_xor = np.bitwise_xor(total_xor, np.bitwise_xor.reduce(h))
+
+    hasher = hashlib.sha1()
+    hasher.update(b"".join(c.encode() + str(df.schema[c]).encode() for c in sorted(df.columns)))
+    hasher.update(df.height.to_bytes(8, "big"))
+    hasher.update(int(total_sum).to_bytes(8, "big"))
+    hasher.update(int(total_xor).to_bytes(8, "big"))
+
+    return hasher.hexdigest()
@@ -1,16 +1,34 @@
+from collections.abc import Sequence
+
 import polars as pl
 
 
-def join(*df: pl.DataFrame, by: list[str]):
+def join[F: (pl.DataFrame, pl.LazyFrame)](*df: F, by: list[str]) -> F:
     table = df[0]
     for frame in df[1:]:
-        columns = sorted(set(frame.columns) - set(col for col in table.columns if col not in by))
+        table_columns = table.collect_schema().names()
+        frame_columns = frame.collect_schema().names()
+        columns = sorted(set(frame_columns) - {col for col in table_columns if col not in by})
         table = table.join(frame.select(columns), on=by, how="left")
     return table
 
 
-def cast_y_null_to_bool(df: pl.DataFrame):
-    is_target = lambda col: col.drop_nulls().unique().len() == 1 and col.drop_nulls().unique()[0] == "Y"
-    target = [col for col in df.columns if df[col].dtype == pl.Utf8 and is_target(df[col])]
+def cast_y_null_to_bool[F: (pl.DataFrame, pl.LazyFrame)](df: F, columns: Sequence[str] | None = None) -> F:
+    """
+    "Y" 또는 null 로만 이루어진 문자열 컬럼을 bool 로 바꿉니다.
+
+    columns 가 주어지면 collect_schema() 로 찾은 문자열 컬럼 중 columns 에 있는 것만 바꾸므로
+    LazyFrame 의 plan 을 실행하지 않습니다. 주어지지 않으면 값을 확인하기 위해 한 번 collect 합니다.
+    """
+    candidates = [col for col, dtype in df.collect_schema().items() if dtype == pl.Utf8]
+    if columns is not None:
+        target = [col for col in candidates if col in columns]
+    else:
+        is_target = df.lazy().select(
+            ((pl.col(col).drop_nulls().n_unique() == 1) & (pl.col(col).drop_nulls().first() == "Y")).alias(col)
+            for col in candidates
+        )
+        is_target = is_target.collect().row(0, named=True) if candidates else {}
+        target = [col for col in candidates if is_target[col]]
     converted_df = [pl.when(pl.col(col) == "Y").then(True).otherwise(False).alias(col) for col in target]
     return df.with_columns(converted_df)
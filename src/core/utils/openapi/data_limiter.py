@@ -0,0 +1,75 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (Additive Increase, Multiplicative Decrease) 방식으로 동시 요청 수를 조절하는 클래스
+
+    요청이 성공할 때마다 한도를 조금씩 늘리고, 서버가 과부하 신호 (429, 5xx, timeout) 를 보내면 한도를 절반으로 줄입니다.
+    한 번의 과부하로 이미 실행 중이던 요청들이 연달아 실패해도 한도는 한 번만 줄어듭니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        """
+        Args:
+            initial_limit (int): 초기 동시 요청 수
+            min_limit (int): 최소 동시 요청 수
+            max_limit (int): 최대 동시 요청 수
+            increase (float): 한도만큼의 요청이 성공했을 때 늘릴 동시 요청 수
+            decrease (float): 과부하 시 한도에 곱할 비율
+        """
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+
+        self._in_flight = 0
+        self._generation = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> int:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+            return self._generation
+
+    async def release(self, generation: int, succeeded: bool = False, overloaded: bool = False):
+        async with self._condition:
+            self._in_flight -= 1
+
+            if succeeded:
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            elif overloaded and generation == self._generation:
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._generation += 1
+
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator["_Slot"]:
+        slot = _Slot(await self.acquire())
+        try:
+            yield slot
+        finally:
+            await self.release(slot.generation, slot.succeeded, slot.overloaded)
+
+
+class _Slot:
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.succeeded = False
+        self.overloaded = False
@@ -1,13 +1,24 @@
 import asyncio
+import hashlib
 import json
+import random
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from itertools import chain
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from itertools import chain, count
 from math import ceil
 
 import httpx
 
+from ..http_client import HttpClientRegistry
+from .data_cache import BaseDataCache
+from .data_limiter import AdaptiveConcurrencyLimiter
+
 
 @dataclass
 class ApiConfig:
@@ -37,6 +48,35 @@ class ApiConfig:
     response_data: str = "data"
 
 
+@dataclass
+class RetryPolicy:
+    max_retries: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    @staticmethod
+    def get_retry_after(response: httpx.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
 class BaseOpenDataLoader(ABC):
     """
     REST API 에서 데이터를 불러오는 클래스
@@ -51,6 +91,21 @@ class BaseOpenDataLoader(ABC):
     swagger_url: str
     api_key: str | None
 
+    @abstractmethod
+    def iter_data(self, path: str, params: dict | None = None) -> AsyncIterator[dict | list[dict]]:
+        """
+        API 의 응답을 페이지 순서대로 하나씩 돌려줍니다.
+        다음 페이지들은 그동안 계속 받아오므로 호출하는 쪽에서 페이지를 처리하는 시간과 네트워크 대기가 겹칩니다.
+
+        Args:
+            path: API Endpoint
+            params: API Query Params
+
+        Returns:
+            페이지 단위 API 의 응답
+        """
+        pass
+
     @abstractmethod
     async def get_data(self, path: str, params: dict | None = None) -> dict | list[dict]:
         """
@@ -75,6 +130,13 @@ class OpenDataLoader(BaseOpenDataLoader):
         concurrency_limit: int = 20,
         timeout: int = 30,
         api_config: ApiConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        checkpoint: BaseDataCache | None = None,
+        docs_ttl: int = 3600,
+        http_clients: HttpClientRegistry | None = None,
+        count_probe: bool = False,
+        max_inflight: int | None = None,
     ):
         """
         Initialize the OpenDataLoader with configurable parameters.
@@ -85,8 +147,17 @@ class OpenDataLoader(BaseOpenDataLoader):
             api_key (str):
             paths (dict):
             batch_size (int):
+            concurrency_limit (int): limiter 를 지정하지 않은 경우 최대 동시 요청 수
             timeout (int):
             api_config (ApiConfig):
+            retry_policy (RetryPolicy): 429, 5xx, timeout 발생 시 페이지 단위 재시도 정책
+            limiter (AdaptiveConcurrencyLimiter): 동시 요청 수 조절기
+            checkpoint (BaseDataCache): 받아온 페이지를 저장해 두었다가 중단된 수집을 이어서 진행할 저장소
+            docs_ttl (int): Swagger 문서를 다시 확인하기 전까지 재사용할 시간 (초)
+            http_clients (HttpClientRegistry): 연결을 공유할 클라이언트 저장소, 없으면 요청마다 클라이언트를 만듭니다.
+            count_probe (bool): True 이면 전체 개수를 크기 1 의 요청으로 먼저 확인하고,
+                False 이면 첫 페이지를 batch_size 로 받아 전체 개수를 읽은 뒤 나머지 페이지를 요청합니다.
+            max_inflight (int): 동시에 받아 두는 최대 페이지 수, 없으면 limiter 의 현재 동시 요청 수를 따릅니다.
         """
         self.base_url = base_url
         self.swagger_url = swagger_url
@@ -98,25 +169,77 @@ class OpenDataLoader(BaseOpenDataLoader):
 
         self._timeout = timeout
         self._batch_size = batch_size
-        self._concurrency_limit = concurrency_limit
         self._api_config = api_config or ApiConfig()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._limiter = limiter or AdaptiveConcurrencyLimiter(max_limit=concurrency_limit)
+        self._checkpoint = checkpoint
+        self._http_clients = http_clients
+        self._count_probe = count_probe
+        self._max_inflight = max_inflight
+
+        self._docs_ttl = docs_ttl
+        self._docs: dict | None = None
+        self._docs_etag: str | None = None
+        self._docs_last_modified: str | None = None
+        self._docs_expires_at: float = 0.0
+        self._docs_applied: dict | None = None
+        self._docs_lock = asyncio.Lock()
+        self._path_meta: dict[str, tuple[str, set]] = {}
+
+    @asynccontextmanager
+    async def get_client(self, base_url: str | None = None) -> AsyncIterator[httpx.AsyncClient]:
+        base_url = self.base_url if base_url is None else base_url
+
+        if self._http_clients is not None:
+            yield self._http_clients.get(base_url)
+            return
 
-    def get_client(self):
-        return httpx.AsyncClient(
-            headers=self.headers,
-            timeout=self._timeout,
-            base_url=self.base_url,
-            params=self.query_params,
-            follow_redirects=True,
-        )
+        async with httpx.AsyncClient(base_url=base_url, timeout=self._timeout, follow_redirects=True) as client:
+            yield client
 
     async def get_docs(self) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url=self.swagger_url)
-        return response.json()
+        async with self._docs_lock:
+            if self._docs is not None and time.monotonic() < self._docs_expires_at:
+                return self._docs
+
+            headers = {}
+            if self._docs is not None and self._docs_etag:
+                headers["If-None-Match"] = self._docs_etag
+            if self._docs is not None and self._docs_last_modified:
+                headers["If-Modified-Since"] = self._docs_last_modified
+
+            # 요청이 실패하거나 오류 응답, JSON 이 아닌 응답을 받으면 이전 문서를 계속 사용하고 다음 호출에서 다시 확인합니다.
+            try:
+                async with self.get_client("") as client:
+                    response = await client.get(url=self.swagger_url, headers=headers, timeout=self._timeout)
+
+                if response.status_code == httpx.codes.NOT_MODIFIED and self._docs is not None:
+                    self._docs_expires_at = time.monotonic() + self._docs_ttl
+                    return self._docs
+
+                response.raise_for_status()
+                docs = response.json()
+            except (httpx.HTTPError, ValueError):
+                if self._docs is None:
+                    raise
+                return self._docs
+
+            self._docs = docs
+            self._docs_etag = response.headers.get("ETag")
+            self._docs_last_modified = response.headers.get("Last-Modified")
+            self._docs_expires_at = time.monotonic() + self._docs_ttl
+            return self._docs
+
+    async def load_docs(self):
+        docs = await self.get_docs()
+
+        if docs is not self._docs_applied:
+            self.apply_docs(docs)
+            self._docs_applied = docs
 
     def apply_docs(self, docs: dict):
         self.paths.update(docs.get(self._api_config.api_path, {}))
+        self._path_meta.clear()
 
         if not self.api_key:
             return
@@ -133,13 +256,9 @@ class OpenDataLoader(BaseOpenDataLoader):
             if method == self._api_config.query:
                 self.query_params[name] = self.api_key
 
-    async def fetch_data(
-        self,
-        client: httpx.AsyncClient,
-        path: str,
-        params: dict | None = None,
-    ) -> dict:
-        params = {} if params is None else params
+    def get_path_meta(self, path: str) -> tuple[str, set]:
+        if path in self._path_meta:
+            return self._path_meta[path]
 
         _path: dict | None = self.paths.get(path, None)
         if _path is None:
@@ -156,16 +275,23 @@ class OpenDataLoader(BaseOpenDataLoader):
             for v in _parameters.values()
             if v.get(self._api_config.api_parameters_required, False)
         }
+
+        self._path_meta[path] = (_method, _parameters_required)
+        return self._path_meta[path]
+
+    async def fetch_data(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict | None = None,
+    ) -> dict:
+        params = {} if params is None else params
+        _method, _parameters_required = self.get_path_meta(path)
+
         if not _parameters_required.issubset(set(params.keys())):
             raise ValueError("Required parameters are missing.", _parameters_required)
 
-        try:
-            response = await getattr(client, _method)(path, params=params)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise ValueError(f"HTTP error occurred: {e.response.status_code}, {e.response.text}")
-        except httpx.RequestError as e:
-            raise ValueError(f"A request error occurred: {str(e)}")
+        response = await self._request(client, _method, path, params)
 
         try:
             data = response.json()
@@ -173,6 +299,47 @@ class OpenDataLoader(BaseOpenDataLoader):
         except (KeyError, IndexError, json.JSONDecodeError) as e:
             raise ValueError(f"Unable to retrieve data: {e}")
 
+    async def _request(self, client: httpx.AsyncClient, method: str, path: str, params: dict) -> httpx.Response:
+        for attempt in count():
+            retry_after = None
+
+            async with self._limiter.hold() as slot:
+                try:
+                    response = await getattr(client, method)(
+                        path,
+                        params={**self.query_params, **params},
+                        headers=self.headers,
+                        timeout=self._timeout,
+                    )
+                except httpx.TransportError as e:
+                    slot.overloaded = True
+                    error = ValueError(f"A request error occurred: {str(e)}")
+                except httpx.RequestError as e:
+                    raise ValueError(f"A request error occurred: {str(e)}")
+                else:
+                    if response.status_code not in self._retry_policy.retry_statuses:
+                        try:
+                            response.raise_for_status()
+                        except httpx.HTTPStatusError as e:
+                            raise ValueError(f"HTTP error occurred: {e.response.status_code}, {e.response.text}")
+
+                        slot.succeeded = True
+                        return response
+
+                    slot.overloaded = True
+                    retry_after = self._retry_policy.get_retry_after(response)
+                    error = ValueError(f"HTTP error occurred: {response.status_code}, {response.text}")
+
+            if attempt >= self._retry_policy.max_retries:
+                raise error
+            await asyncio.sleep(self._retry_policy.get_delay(attempt, retry_after))
+
+    def get_total_count(self, path: str, response: dict) -> int:
+        return response.get(self._api_config.response_total_count, 0)
+
+    def get_page_data(self, path: str, response: dict) -> list[dict]:
+        return response.get(self._api_config.response_data)
+
     async def fetch_total_record_count(
         self,
         client: httpx.AsyncClient,
@@ -183,9 +350,16 @@ class OpenDataLoader(BaseOpenDataLoader):
         params[self._api_config.request_size] = 1
 
         data = await self.fetch_data(client, path, params)
-        data = data.get(self._api_config.response_total_count, 0)
+        return self.get_total_count(path, data)
 
-        return data
+    async def fetch_first_page(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict,
+    ) -> tuple[int, list[dict] | None]:
+        response = await self.fetch_data(client, path, {**params, self._api_config.request_page: 1})
+        return self.get_total_count(path, response), self.get_page_data(path, response)
 
     async def _page_fetcher(
         self,
@@ -193,52 +367,112 @@ class OpenDataLoader(BaseOpenDataLoader):
         path: str,
         page: int,
         params: dict | None = None,
-        semaphore: asyncio.Semaphore = None,
     ):
-        async with semaphore if semaphore else asyncio.Semaphore(self._concurrency_limit):
-            params[self._api_config.request_page] = page
-            response = await self.fetch_data(client, path, params)
-            return response.get(self._api_config.response_data)
+        params = {**(params or {}), self._api_config.request_page: page}
+        response = await self.fetch_data(client, path, params)
+        return self.get_page_data(path, response)
 
-    async def fetch_paginated_data(
+    async def fetch_page_params(
         self,
         client: httpx.AsyncClient,
         path: str,
-        params: dict | None = None,
-        semaphore: asyncio.Semaphore = None,
-    ) -> list[dict]:
-        params = {} if params is None else params
-        total_count = await self.fetch_total_record_count(client, path, params)
+        params: dict,
+    ) -> list[tuple[int, dict, list[dict] | None]]:
+        params = {**params, self._api_config.request_size: self._batch_size}
+
+        if self._count_probe:
+            total_count = await self.fetch_total_record_count(client, path, params.copy())
+            first_page = None
+        else:
+            total_count, first_page = await self.fetch_first_page(client, path, params)
 
         if not total_count:
             return []
 
-        params[self._api_config.request_size] = self._batch_size
-        tasks = [
-            self._page_fetcher(
-                client,
-                path,
-                page,
-                params,
-                semaphore,
+        pages = range(1, ceil(total_count / self._batch_size) + 1)
+        return [(page, params, first_page if page == 1 else None) for page in pages]
+
+    async def iter_paginated_data(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        pages: list[tuple[int, dict, list[dict] | None]],
+    ) -> AsyncIterator[list[dict]]:
+        # 받아 둔 페이지가 소비되어야 다음 페이지를 요청하므로 메모리에는 window 만큼의 페이지만 남습니다.
+        remaining = iter(pages)
+        tasks: deque[asyncio.Task] = deque()
+
+        def schedule():
+            window = self._max_inflight or max(1, int(self._limiter.limit))
+            while len(tasks) < window and (item := next(remaining, None)) is not None:
+                page, params, data = item
+                tasks.append(asyncio.create_task(self._checkpoint_fetcher(client, path, page, params, data)))
+
+        try:
+            schedule()
+            while tasks:
+                data = await tasks[0]
+                tasks.popleft()
+                schedule()
+                yield data
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._checkpoint is not None:
+            await self._checkpoint.delete_cache(
+                *(self.get_checkpoint_key(path, page, params) for page, params, _ in pages)
             )
-            for page in range(1, ceil(total_count / self._batch_size) + 1)
-        ]
-        data = list(chain.from_iterable(await asyncio.gather(*tasks)))
 
+    def get_checkpoint_key(self, path: str, page: int, params: dict) -> str:
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{path}:{digest}:{page}"
+
+    async def _checkpoint_fetcher(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        page: int,
+        params: dict,
+        data: list[dict] | None = None,
+    ):
+        if self._checkpoint is None:
+            return data if data is not None else await self._page_fetcher(client, path, page, params)
+
+        key = self.get_checkpoint_key(path, page, params)
+        if data is not None:
+            await self._checkpoint.set_cache(key, data)
+            return data
+
+        data = await self._checkpoint.get_cache(key)
+        if data is None:
+            data = await self._page_fetcher(client, path, page, params)
+            await self._checkpoint.set_cache(key, data)
         return data
 
-    async def get_data(self, path: str, params: dict | None = None) -> dict | list[dict]:
+    async def iter_data(self, path: str, params: dict | None = None) -> AsyncIterator[dict | list[dict]]:
         if self.swagger_url:
-            docs = await self.get_docs()
-            self.apply_docs(docs)
+            await self.load_docs()
 
         params = {} if params is None else params
-        semaphore = asyncio.Semaphore(self._concurrency_limit)
 
         async with self.get_client() as client:
-            data = await self.fetch_paginated_data(client, path, params, semaphore)
-            return data if data else await self.fetch_data(client, path, params)
+            pages = await self.fetch_page_params(client, path, params)
+
+            if not pages:
+                yield await self.fetch_data(client, path, params)
+                return
+
+            async for data in self.iter_paginated_data(client, path, pages):
+                yield data
+
+    async def get_data(self, path: str, params: dict | None = None) -> dict | list[dict]:
+        pages = [data async for data in self.iter_data(path, params)]
+
+        if len(pages) == 1 and isinstance(pages[0], dict):
+            return pages[0]
+        return list(chain.from_iterable(pages))
 
 
 class FiscalDataLoader(OpenDataLoader):
@@ -250,60 +484,108 @@ class FiscalDataLoader(OpenDataLoader):
         paths: dict | None = None,
         start_year: int | None = None,
         end_year: int | None = None,
+        open_years: int = 2,
         batch_size: int = 1000,
         concurrency_limit: int = 20,
         timeout: int = 30,
         api_config: ApiConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        checkpoint: BaseDataCache | None = None,
+        docs_ttl: int = 3600,
+        http_clients: HttpClientRegistry | None = None,
+        count_probe: bool = False,
+        max_inflight: int | None = None,
     ):
-        super().__init__(base_url, swagger_url, api_key, paths, batch_size, concurrency_limit, timeout, api_config)
+        super().__init__(
+            base_url,
+            swagger_url,
+            api_key,
+            paths,
+            batch_size,
+            concurrency_limit,
+            timeout,
+            api_config,
+            retry_policy,
+            limiter,
+            checkpoint,
+            docs_ttl,
+            http_clients,
+            count_probe,
+            max_inflight,
+        )
 
         self.start_year = start_year or datetime.now().year - 30
         self.end_year = end_year or datetime.now().year + 1
+        self.open_years = open_years
 
-    async def fetch_total_record_count(
+    def get_open_years(self) -> list[str]:
+        """
+        아직 데이터가 바뀔 수 있는 회계연도 (기본값은 올해와 내년) 를 돌려줍니다.
+        """
+        end_year = datetime.now().year + 1
+        return [str(year) for year in range(end_year - self.open_years + 1, end_year + 1)]
+
+    def get_total_count(self, path: str, response: dict) -> int:
+        """
+        데이터가 없는 회계연도는 head 없이 INFO-200 결과만 돌아오므로 0 을 돌려줍니다.
+        그 밖의 결과 코드는 인증키나 요청 오류이므로 ValueError 를 발생시킵니다.
+        """
+        result = response.get("RESULT") if isinstance(response, dict) else None
+        if result is not None:
+            if result.get("CODE") == "INFO-200":
+                return 0
+            raise ValueError(f"API error occurred: {result.get('CODE')}, {result.get('MESSAGE')}")
+
+        try:
+            return response[path][0]["head"][0]["list_total_count"]
+        except (KeyError, IndexError, TypeError):
+            return 0
+
+    def get_page_data(self, path: str, response: dict) -> list[dict]:
+        return response[path][1]["row"]
+
+    async def fetch_first_page(
         self,
         client: httpx.AsyncClient,
         path: str,
         params: dict,
-    ) -> int:
-        params[self._api_config.request_page] = 1
-        params[self._api_config.request_size] = 1
+    ) -> tuple[int, list[dict] | None]:
+        # 요청 실패는 그대로 전달합니다. 빈 연도로 보면 증분 갱신에서 그 연도의 행이 지워집니다.
+        response = await self.fetch_data(client, path, {**params, self._api_config.request_page: 1})
+        total_count = self.get_total_count(path, response)
+        return total_count, self.get_page_data(path, response) if total_count else None
 
-        try:
-            data = await self.fetch_data(client, path, params)
-            return data[path][0]["head"][0]["list_total_count"]
-        except (KeyError, IndexError, ValueError, TypeError):
-            return 0
-
-    async def _page_fetcher(
+    async def fetch_page_params(
         self,
         client: httpx.AsyncClient,
         path: str,
-        page: int,
-        params: dict | None = None,
-        semaphore: asyncio.Semaphore = None,
-    ):
-        async with semaphore if semaphore else asyncio.Semaphore(self._concurrency_limit):
-            params[self._api_config.request_page] = page
-            response = await self.fetch_data(client, path, params)
-            return response[path][1]["row"]
+        params: dict,
+        years: list[str] | None = None,
+    ) -> list[tuple[int, dict, list[dict] | None]]:
+        if years is None:
+            years = [str(year) for year in range(self.start_year, self.end_year + 1)]
 
-    async def get_data(self, path: str, params: dict | None = None) -> dict | list[dict]:
+        tasks = []
+        for year in years:
+            _params = {**params, self._api_config.request_year: year}
+            tasks.append(super().fetch_page_params(client, path, _params))
+
+        return list(chain.from_iterable(await asyncio.gather(*tasks)))
+
+    async def iter_data(
+        self,
+        path: str,
+        params: dict | None = None,
+        years: list[str] | None = None,
+    ) -> AsyncIterator[list[dict]]:
         if self.swagger_url:
-            docs = await self.get_docs()
-            self.apply_docs(docs)
+            await self.load_docs()
 
         params = {} if params is None else params
-        semaphore = asyncio.Semaphore(self._concurrency_limit)
-        client = self.get_client()
 
-        async def fetch(year):
-            _params = params.copy()
-            _params[self._api_config.request_year] = year
-            return await self.fetch_paginated_data(client, path, _params, semaphore)
-
-        tasks = [fetch(str(year)) for year in range(self.start_year, self.end_year + 1)]
-        data = list(chain.from_iterable(await asyncio.gather(*tasks)))
+        async with self.get_client() as client:
+            pages = await self.fetch_page_params(client, path, params, years)
 
-        await client.aclose()
-        return data
+            async for data in self.iter_paginated_data(client, path, pages):
+                yield data
@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from sqlalchemy import text
+from webtool.cache import RedisCache
+from webtool.db import AsyncDB
+
+
+class BaseDataLock(ABC):
+    """
+    여러 프로세스 중 하나의 프로세스만 데이터 작업을 수행하도록 하는 클래스
+
+    Attributes:
+        key_prefix (str): 키 전치사
+    """
+
+    key_prefix: str
+
+    @abstractmethod
+    def hold(self, key: str, wait: bool = False) -> AsyncIterator[bool]:
+        """
+        잠금을 획득하고 블록이 끝날 때까지 유지합니다.
+
+        Args:
+            key (str): Lock Key
+            wait (bool): 잠금을 얻지 못한 경우 다른 프로세스의 작업이 끝날 때까지 대기할지 여부
+
+        Returns:
+            잠금을 획득했다면 True (리더), 그렇지 않다면 False
+        """
+        pass
+
+
+class PostgresDataLock(BaseDataLock):
+    """
+    Postgres 의 세션 수준 advisory lock 을 사용합니다.
+    잠금은 전용 연결에서 유지되므로 리더 프로세스가 종료되어 연결이 끊기면 자동으로 해제됩니다.
+    """
+
+    def __init__(self, db: AsyncDB, key_prefix: str = ""):
+        self.db = db
+        self.key_prefix = key_prefix
+
+    def get_lock_id(self, key: str) -> int:
+        digest = hashlib.sha1(f"{self.key_prefix}{key}".encode()).digest()
+        return int.from_bytes(digest[:8], "big", signed=True)
+
+    @asynccontextmanager
+    async def hold(self, key: str, wait: bool = False) -> AsyncIterator[bool]:
+        lock_id = self.get_lock_id(key)
+
+        # 잠금을 얻지 못한 프로세스는 (대기한 뒤) 바로 연결을 반납하고, 리더만 블록이 끝날 때까지 연결을 유지합니다.
+        async with self.db.engine.connect() as conn:
+            result = await conn.execute(text("SELECT pg_try_advisory_lock(:id)"), {"id": lock_id})
+            acquired = bool(result.scalar())
+
+            if not acquired and wait:
+                await conn.execute(text("SELECT pg_advisory_lock_shared(:id)"), {"id": lock_id})
+                await conn.execute(text("SELECT pg_advisory_unlock_shared(:id)"), {"id": lock_id})
+            await conn.commit()
+
+            if acquired:
+                try:
+                    yield True
+                finally:
+                    await conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": lock_id})
+                    await conn.commit()
+                return
+
+        yield False
+
+
+class RedisDataLock(BaseDataLock):
+    """
+    Redis 의 키를 lease 로 사용하는 잠금
+    잠금을 가진 동안 lease 를 주기적으로 연장하며, 프로세스가 종료되면 lease 가 만료되어 잠금이 풀립니다.
+    대기하는 프로세스는 poll_interval 마다 잠금이 풀렸는지 확인합니다.
+    """
+
+    _RENEW = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) end return 0"
+    _RELEASE = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def __init__(self, cache: RedisCache, key_prefix: str = "", lease_ms: int = 30000, poll_interval: float = 0.5):
+        """
+        Args:
+            cache (RedisCache): Redis 클라이언트
+            key_prefix (str): 키 전치사
+            lease_ms (int): 잠금의 lease (ms)
+            poll_interval (float): 대기 중 잠금을 확인하는 주기 (초)
+        """
+        self.cache = cache
+        self.key_prefix = key_prefix
+        self.lease_ms = lease_ms
+        self.poll_interval = poll_interval
+
+    def get_lock_key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    @asynccontextmanager
+    async def hold(self, key: str, wait: bool = False) -> AsyncIterator[bool]:
+        lock_key = self.get_lock_key(key)
+        token = uuid.uuid4().hex
+        client = self.cache.cache
+
+        acquired = bool(await client.set(lock_key, token, nx=True, px=self.lease_ms))
+
+        if not acquired:
+            while wait and await client.exists(lock_key):
+                await asyncio.sleep(self.poll_interval)
+            yield False
+            return
+
+        renewer = asyncio.create_task(self._renew(lock_key, token))
+        try:
+            yield True
+        finally:
+            renewer.cancel()
+            with suppress(asyncio.CancelledError):
+                await renewer
+            await client.eval(self._RELEASE, 1, lock_key, token)
+
+    async def _renew(self, lock_key: str, token: str):
+        while True:
+            await asyncio.sleep(self.lease_ms / 3000)
+            await self.cache.cache.eval(self._RENEW, 1, lock_key, token, self.lease_ms)
@@ -1,12 +1,18 @@
+import asyncio
 import inspect
 import json
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any, Callable
 
 import polars as pl
 
 from .data_cache import BaseDataCache
-from .data_loader import BaseOpenDataLoader
+from .data_loader import BaseOpenDataLoader, FiscalDataLoader
+from .data_lock import BaseDataLock
 
 
 async def execute(func, *args, **kwargs):
@@ -16,24 +22,79 @@ async def execute(func, *args, **kwargs):
         return func(*args, **kwargs)
 
 
+class CallbackExecutor:
+    """
+    DataManager 의 콜백을 이벤트 루프 밖의 스레드 혹은 프로세스 풀에서 실행하는 클래스
+    실행 중이거나 대기 중인 콜백이 max_pending 개를 넘으면 자리가 날 때까지 submit 이 대기합니다.
+    Polars 는 연산 중 GIL 을 해제하므로 스레드 풀만으로도 여러 DataSaver 가 병렬로 실행됩니다.
+    """
+
+    def __init__(self, executor: Executor | None = None, max_pending: int = 16):
+        """
+        Args:
+            executor (Executor): 콜백을 실행할 Executor, 기본값은 ThreadPoolExecutor 입니다.
+            max_pending (int): 동시에 제출할 수 있는 콜백 수
+        """
+        self.executor = executor or ThreadPoolExecutor(thread_name_prefix="data-callback")
+        self._semaphore = asyncio.Semaphore(max_pending)
+
+    async def submit(self, func: Callable, *args, **kwargs):
+        async with self._semaphore:
+            if inspect.iscoroutinefunction(func):
+                return await func(*args, **kwargs)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
+
+
 class BaseDataManager(ABC):
     """
     REST API 의 데이터를 캐시하는 클래스
 
     Attributes:
         data (Any): 데이터
+        last_refreshed_at (datetime): 마지막으로 데이터를 불러온 시각
+        last_refresh_duration (float): 마지막으로 데이터를 불러오는 데 걸린 시간 (초)
     """
 
     data: Any
     is_initialized: bool
+    version: int
+    last_refreshed_at: datetime | None
+    last_refresh_duration: float | None
     path: str
     params: dict
     id: int
 
     @abstractmethod
-    async def init(self):
+    async def init(self, always_reload: bool = False, notify: bool = True) -> bool:
         """
         BaseDataManager 의 데이터를 초기화하는 클래스
+
+        Args:
+            always_reload (bool): 캐시를 무시하고 다시 불러올지 여부
+            notify (bool): 데이터가 바뀌었을 때 콜백을 실행할지 여부, False 라면 호출한 쪽에서 notify_callbacks 를 실행합니다.
+
+        Returns:
+            데이터가 바뀌었다면 True
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def callbacks(self) -> list[Callable]:
+        pass
+
+    @abstractmethod
+    async def notify_callbacks(self, callbacks: list[Callable] | None = None):
+        """
+        콜백을 실행합니다.
+
+        Args:
+            callbacks (list): 실행할 콜백, 없다면 등록된 모든 콜백을 실행합니다.
         """
         pass
 
@@ -56,33 +117,131 @@ class PolarsDataManager(BaseDataManager):
         path: str,
         params: dict | None = None,
         infer_scheme_length: int = 100000,
+        callback_executor: CallbackExecutor | None = None,
+        data_lock: BaseDataLock | None = None,
     ):
+        """
+        Args:
+            data_loader (BaseOpenDataLoader): 데이터를 불러올 DataLoader
+            data_cache (BaseDataCache): 데이터를 저장할 DataCache
+            path (str): API Endpoint
+            params (dict): API Query Params
+            infer_scheme_length (int): 스키마를 추론할 행 수
+            callback_executor (CallbackExecutor): 콜백을 실행할 Executor, 없으면 이벤트 루프에서 순서대로 실행합니다.
+            data_lock (BaseDataLock): 캐시가 비어 있을 때 여러 프로세스 중 하나만 데이터를 불러오도록 하는 잠금
+        """
         self.data: pl.DataFrame = pl.DataFrame()
         self.path: str = path
         self.params: dict = params or {}
         self.is_initialized: bool = False
+        self.version: int = 0
+        self.last_refreshed_at: datetime | None = None
+        self.last_refresh_duration: float | None = None
         self._data_loader = data_loader
         self._data_cache = data_cache
         self._infer_scheme_length = infer_scheme_length
         self._callbacks: list[Callable] = []
+        self._callback_executor = callback_executor
+        self._data_lock = data_lock
         self.id = hash(json.dumps(self.params).encode() + self.path.encode())
 
-    async def init(self, always_reload: bool = False):
+    async def init(self, always_reload: bool = False, notify: bool = True) -> bool:
+        started = time.perf_counter()
+
         if not always_reload:
             data = await self._data_cache.get_cache(self.path)
         else:
             data = None
 
         if data is None:
-            data = await self._data_loader.get_data(self.path, self.params)
-            await self._data_cache.set_cache(self.path, data)
+            data = await self._fill()
+
+        if not isinstance(data, pl.DataFrame):
+            data = pl.DataFrame(data, infer_schema_length=self._infer_scheme_length)
+
+        self.last_refreshed_at = datetime.now(UTC)
+        self.last_refresh_duration = time.perf_counter() - started
 
-        self.data = pl.DataFrame(data, infer_schema_length=self._infer_scheme_length)
+        if self.is_initialized and data.equals(self.data):
+            return False
+
+        self.data = data
+        self.version += 1
         self.is_initialized = True
-        await self._notify_callbacks()
+        if notify:
+            await self.notify_callbacks()
+        return True
+
+    async def _fill(self) -> Any:
+        if self._data_lock is None:
+            data = await self._load()
+            await self._data_cache.set_cache(self.path, data)
+            return data
 
-    async def _notify_callbacks(self):
-        [await execute(callback) for callback in self._callbacks]
+        # 다른 프로세스가 이미 불러오는 중이라면 끝날 때까지 기다린 뒤 그 결과를 캐시에서 읽습니다.
+        async with self._data_lock.hold(self.path, wait=True) as acquired:
+            if not acquired:
+                data = await self._data_cache.get_cache(self.path)
+                if data is not None:
+                    return data
+
+            data = await self._load()
+            await self._data_cache.set_cache(self.path, data)
+            return data
+
+    async def _load(self) -> pl.DataFrame:
+        frames = [
+            pl.DataFrame(page, infer_schema_length=self._infer_scheme_length)
+            async for page in self._data_loader.iter_data(self.path, self.params)
+        ]
+        if not frames:
+            return pl.DataFrame()
+        return pl.concat(frames, how="diagonal_relaxed", rechunk=True)
+
+    @property
+    def callbacks(self) -> list[Callable]:
+        return list(self._callbacks)
+
+    async def notify_callbacks(self, callbacks: list[Callable] | None = None):
+        callbacks = self._callbacks if callbacks is None else callbacks
+        if self._callback_executor is None:
+            [await execute(callback) for callback in callbacks]
+        else:
+            await asyncio.gather(*(self._callback_executor.submit(callback) for callback in callbacks))
 
     def register_callback(self, callback: Callable):
         self._callbacks.append(callback)
+
+
+class FiscalPolarsDataManager(PolarsDataManager):
+    """
+    마감된 회계연도의 데이터는 유지하고, 바뀔 수 있는 회계연도만 다시 불러와 합치는 DataManager
+    처음 불러올 때와 데이터가 비어 있을 때는 전체 회계연도를 불러옵니다.
+    """
+
+    def __init__(
+        self,
+        data_loader: FiscalDataLoader,
+        data_cache: BaseDataCache,
+        path: str,
+        params: dict | None = None,
+        infer_scheme_length: int = 100000,
+        callback_executor: CallbackExecutor | None = None,
+        data_lock: BaseDataLock | None = None,
+        year_column: str = "FSCL_YY",
+    ):
+        super().__init__(data_loader, data_cache, path, params, infer_scheme_length, callback_executor, data_lock)
+        self._data_loader: FiscalDataLoader = data_loader
+        self._year_column = year_column
+
+    async def _load(self) -> pl.DataFrame:
+        if not self.is_initialized or self._year_column not in self.data.columns:
+            return await super()._load()
+
+        years = self._data_loader.get_open_years()
+        frames = [
+            pl.DataFrame(page, infer_schema_length=self._infer_scheme_length)
+            async for page in self._data_loader.iter_data(self.path, self.params, years)
+        ]
+        closed = self.data.filter(~pl.col(self._year_column).cast(pl.String).is_in(years))
+        return pl.concat([closed, *frames], how="diagonal_relaxed", rechunk=True)
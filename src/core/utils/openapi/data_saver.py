@@ -1,30 +1,38 @@
-import hashlib
+import threading
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections.abc import Sequence
+from typing import Literal, TypeVar
 
 import polars as pl
 import sqlalchemy
-from sqlalchemy import Column, Index, Integer, MetaData, Table, delete
-from sqlalchemy.engine import Engine
+from sqlalchemy import BigInteger, Column, Index, Integer, MetaData, Table, and_, delete, or_, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import DeclarativeBase
 from webtool.db import SyncDB
 
+from .data_hash import hash_df, hash_rows
 from .data_manager import BaseDataManager
+from .data_stage import PolarsDataStage
 
 T = TypeVar("T", bound=DeclarativeBase)
 
 
-def hash_df(df: pl.DataFrame) -> str:
-    df = df.select(df.columns).sort(by=sorted(df.columns))
-
-    hasher = hashlib.sha1()
-    schema_hash = [c.encode() + str(t).encode() for c, t in df.schema.items()]
-    row_hash = [h.to_bytes(64) for h in df.hash_rows()]
-
-    hasher.update(b"".join(schema_hash))
-    hasher.update(b"".join(row_hash))
+def check_unique_keys(data: pl.DataFrame, key: Sequence[str], name: str = ""):
+    """
+    key 가 겹치는 행이 있다면 개수와 예시 key 를 담아 ValueError 를 발생시킵니다.
+    겹치는 행을 합치는 방법은 데이터마다 다르므로 DataSaver 의 plan 에서 미리 처리해야 합니다.
 
-    return hasher.hexdigest()
+    Args:
+        data (pl.DataFrame): 데이터
+        key (Sequence[str]): 행을 구분하는 자연 키
+        name (str): 오류 메시지에 사용할 이름
+    """
+    key = list(key)
+    duplicated = data.select(key).is_duplicated()
+    if duplicated.any():
+        sample = data.filter(duplicated).select(key).unique(maintain_order=True).head(3).rows()
+        raise ValueError(f"{name}: {duplicated.sum()} rows share a duplicate key {key}, e.g. {sample}")
 
 
 class BaseDataSaver(ABC):
@@ -44,25 +52,96 @@ class PostgresDataSaver(BaseDataSaver):
         db: SyncDB,
         table: type[T],
         hash_table: str | None = None,
+        loader: Literal["insert", "copy"] = "insert",
+        strategy: Literal["replace", "swap", "upsert"] = "replace",
+        key: Sequence[str] | None = None,
+        copy_chunk_size: int = 100000,
+        batch_size: int = 1000,
+        stage: PolarsDataStage | None = None,
+        engine: Literal["auto", "in-memory", "streaming"] = "streaming",
     ):
+        """
+        Args:
+            data (BaseDataManager): 데이터를 가져올 DataManager
+            db (SyncDB): 저장할 DB
+            table (type[T]): 저장할 테이블
+            hash_table (str): 데이터 해시를 저장할 테이블 이름
+            loader (str): "insert" 는 write_database 를, "copy" 는 COPY FROM STDIN 을 사용합니다.
+            strategy (str): "replace" 는 테이블을 비우고 다시 채우고, "swap" 은 섀도 테이블을 채운 뒤 교체합니다.
+                "upsert" 는 key 기준으로 변경된 행만 반영합니다.
+            key (Sequence[str]): upsert 에 사용할 자연 키, 테이블에 같은 컬럼의 unique 인덱스가 있어야 합니다.
+            copy_chunk_size (int): COPY 로 한 번에 전송할 행 수
+            batch_size (int): upsert 와 delete 를 한 번에 실행할 행 수
+            stage (PolarsDataStage): 다른 DataSaver 와 공유하는 전처리 단계, 지정하면 plan 을 구현해야 합니다.
+            engine (str): build_lazy 의 결과를 collect 할 Polars 엔진
+        """
         self.db = db
         self.manager: tuple[BaseDataManager, ...] = tuple(data)
         self.table = table
         self.hash_table = hash_table or "_temp_polars_hasher"
+        self.loader = loader
+        self.strategy = strategy
+        self.key = list(key or [])
+        self.copy_chunk_size = copy_chunk_size
+        self.batch_size = batch_size
+        self.stage = stage
+        self.engine = engine
+        self._lock = threading.Lock()
+
+        if self.strategy == "upsert" and not self.key:
+            raise ValueError("key must be specified for upsert strategy")
 
         [m.register_callback(self._callback) for m in self.manager]
+        if self.stage is not None:
+            self.stage.register(self)
 
     def build(self) -> pl.DataFrame:
-        raise NotImplementedError("build method must be implemented by subclass")
+        if self.stage is not None:
+            return self.stage.collect(self)
+        return self.build_lazy().collect(engine=self.engine)
+
+    def build_lazy(self) -> pl.LazyFrame:
+        if self.stage is None:
+            raise NotImplementedError("build_lazy method must be implemented by subclass")
+        return self.plan(self.stage.lazy())
+
+    def plan(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        raise NotImplementedError("plan method must be implemented by subclass")
+
+    def explain(self, optimized: bool = True) -> str:
+        """
+        build_lazy 가 만드는 쿼리 계획을 돌려줍니다.
+
+        Args:
+            optimized (bool): 최적화된 계획을 보여줄지 여부
+        """
+        return self.build_lazy().explain(optimized=optimized)
 
     def _callback(self):
         if all(manager.is_initialized for manager in self.manager):
-            data = self.build()
-            self._save(data)
+            with self._lock:
+                data = self.build()
+                self._save(data)
 
     def _save(self, data: pl.DataFrame):
         hash_data = hash_df(data)
 
+        if self._is_saved(hash_data):
+            print(f"🔹The same data already exists name {self.table.__tablename__}, skipping the operation.")
+            return
+
+        if self.strategy == "upsert":
+            self._upsert(data)
+        elif self.strategy == "swap":
+            self._swap(data)
+        else:
+            self._replace(data)
+
+        pl.DataFrame({"table_name": [self.table.__tablename__], "hash": [hash_data]}).write_database(
+            self.hash_table, connection=self.db.engine, if_table_exists="append"
+        )
+
+    def _is_saved(self, hash_data: str) -> bool:
         try:
             saved_hash = pl.read_database(
                 query=f"SELECT * FROM {self.hash_table} WHERE table_name = :table_name AND hash = :hash",
@@ -70,12 +149,10 @@ class PostgresDataSaver(BaseDataSaver):
                 execute_options={"parameters": {"table_name": self.table.__tablename__, "hash": hash_data}},
             )
         except sqlalchemy.exc.ProgrammingError:
-            pass
-        else:
-            if not saved_hash.is_empty():
-                print(f"🔹The same data already exists name {self.table.__tablename__}, skipping the operation.")
-                return
+            return False
+        return not saved_hash.is_empty()
 
+    def _replace(self, data: pl.DataFrame):
         try:
             with self.db.engine.connect() as conn:
                 with conn.begin():
@@ -83,11 +160,176 @@ class PostgresDataSaver(BaseDataSaver):
         except sqlalchemy.exc.ProgrammingError:
             pass
 
-        data.write_database(self.table.__tablename__, connection=self.db.engine, if_table_exists="append")
-        pl.DataFrame({"table_name": [self.table.__tablename__], "hash": [hash_data]}).write_database(
-            self.hash_table, connection=self.db.engine, if_table_exists="append"
+        self._write(data, self.table.__tablename__)
+        self._drop_row_hash()
+
+    def _swap(self, data: pl.DataFrame):
+        """
+        인덱스가 없는 섀도 테이블(<name>__staging)에 데이터를 적재하고, 적재가 끝난 뒤 인덱스를 생성합니다.
+        이후 하나의 트랜잭션 안에서 기존 테이블을 삭제하고 섀도 테이블의 이름을 바꿔 교체합니다.
+        """
+        table: Table = self.table.__table__
+        staging = table.to_metadata(MetaData(), name=f"{table.name}__staging")
+        staging.indexes.clear()
+
+        staging.drop(self.db.engine, checkfirst=True)
+        staging.create(self.db.engine)
+        self._write(data, staging.name)
+
+        indexes = [
+            Index(
+                f"{index.name}__staging",
+                *(staging.c[c.name] for c in index.columns),
+                unique=index.unique,
+                **index.dialect_kwargs,
+            )
+            for index in table.indexes
+        ]
+        with self.db.engine.begin() as conn:
+            [index.create(bind=conn) for index in indexes]
+
+        q = self.db.engine.dialect.identifier_preparer.quote
+        with self.db.engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {q(table.name)}"))
+            conn.execute(text(f"ALTER TABLE {q(staging.name)} RENAME TO {q(table.name)}"))
+            conn.execute(text(f"ALTER INDEX IF EXISTS {q(f'{staging.name}_pkey')} RENAME TO {q(f'{table.name}_pkey')}"))
+            for index in table.indexes:
+                conn.execute(text(f"ALTER INDEX {q(f'{index.name}__staging')} RENAME TO {q(index.name)}"))
+            for column in table.primary_key.columns:
+                old_sequence, new_sequence = f"{staging.name}_{column.name}_seq", f"{table.name}_{column.name}_seq"
+                conn.execute(text(f"ALTER SEQUENCE IF EXISTS {q(old_sequence)} RENAME TO {q(new_sequence)}"))
+
+        self._drop_row_hash()
+
+    @property
+    def row_hash_table(self) -> Table:
+        table: Table = self.table.__table__
+        return Table(
+            f"{table.name}__row_hash",
+            MetaData(),
+            *(Column(k, table.c[k].type) for k in self.key),
+            Column("row_hash", BigInteger),
+        )
+
+    def _drop_row_hash(self):
+        if self.key:
+            self.row_hash_table.drop(self.db.engine, checkfirst=True)
+
+    def _upsert(self, data: pl.DataFrame):
+        """
+        행 단위 해시를 <name>__row_hash 테이블에 저장해 두고, 새 데이터와 비교하여 추가/변경/삭제된 행만 반영합니다.
+        저장된 행 해시가 없으면 한 번 전체 교체를 수행합니다.
+        """
+        row_hash_table = self.row_hash_table
+        check_unique_keys(data, self.key, self.table.__tablename__)
+        hashes = data.select(*self.key, hash_rows(data).reinterpret(signed=True).alias("row_hash"))
+
+        try:
+            saved = pl.read_database(
+                query=f"SELECT * FROM {self.db.engine.dialect.identifier_preparer.quote(row_hash_table.name)}",
+                connection=self.db.engine,
+                schema_overrides=hashes.schema,
+            )
+        except sqlalchemy.exc.ProgrammingError:
+            self._swap(data)
+            row_hash_table.create(self.db.engine)
+            self._write(hashes, row_hash_table.name)
+            return
+
+        inserted = hashes.join(saved, on=self.key, how="anti", nulls_equal=True)
+        deleted = saved.join(hashes, on=self.key, how="anti", nulls_equal=True).select(self.key)
+        updated = (
+            hashes.join(saved, on=self.key, how="inner", nulls_equal=True, suffix="_saved")
+            .filter(pl.col("row_hash") != pl.col("row_hash_saved"))
+            .select(hashes.columns)
+        )
+        changed = pl.concat([inserted, updated])
+        rows = data.join(changed.select(self.key), on=self.key, how="semi", nulls_equal=True)
+
+        print(
+            f"🔹Upsert {self.table.__tablename__}: "
+            f"{inserted.height} inserted, {updated.height} updated, {deleted.height} deleted."
+        )
+
+        table: Table = self.table.__table__
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[k] for k in self.key],
+            set_={c: stmt.excluded[c] for c in rows.columns if c not in self.key},
+        )
+
+        with self.db.engine.begin() as conn:
+            self._delete_keys(conn, table, deleted)
+            self._delete_keys(conn, row_hash_table, pl.concat([deleted, updated.select(self.key)]))
+            for batch in rows.iter_slices(self.batch_size):
+                conn.execute(stmt, batch.to_dicts())
+            for batch in changed.iter_slices(self.batch_size):
+                conn.execute(row_hash_table.insert(), batch.to_dicts())
+
+    def _delete_keys(self, conn: Connection, table: Table, keys: pl.DataFrame):
+        columns = [table.c[k] for k in self.key]
+
+        for batch in keys.iter_slices(self.batch_size):
+            if batch.null_count().sum_horizontal().item() == 0:
+                clause = tuple_(*columns).in_(batch.rows())
+            else:
+                clause = or_(
+                    *(
+                        and_(*(c.is_not_distinct_from(v) for c, v in zip(columns, row, strict=True)))
+                        for row in batch.rows()
+                    )
+                )
+            conn.execute(delete(table).where(clause))
+
+    def _write(self, data: pl.DataFrame, table_name: str):
+        if self.loader == "copy":
+            self._copy(data, table_name)
+        else:
+            data.write_database(table_name, connection=self.db.engine, if_table_exists="append")
+
+    def _cast_integer_columns(self, data: pl.DataFrame) -> pl.DataFrame:
+        """
+        정수 컬럼에 저장할 실수 컬럼을 Int64 로 변환합니다. COPY 는 1.0 같은 값을 정수 컬럼에 넣지 못합니다.
+        """
+        columns = self.table.__table__.c
+        return data.with_columns(
+            pl.col(name).cast(pl.Int64)
+            for name, dtype in data.schema.items()
+            if dtype.is_float() and name in columns and isinstance(columns[name].type, sqlalchemy.Integer)
         )
 
+    def _copy(self, data: pl.DataFrame, table_name: str):
+        """
+        DataFrame 을 CSV 로 나누어 인코딩하여 COPY FROM STDIN 으로 전송합니다.
+        CSV 인코딩은 Polars 가 Arrow 버퍼에서 직접 수행하므로 파이썬 튜플이 만들어지지 않습니다.
+        """
+        if table_name == self.table.__tablename__:
+            self.table.__table__.create(self.db.engine, checkfirst=True)
+
+        preparer = self.db.engine.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(column) for column in data.columns)
+        stmt = f"COPY {preparer.quote(table_name)} ({columns}) FROM STDIN (FORMAT CSV, NULL '\\N')"
+
+        data = self._cast_integer_columns(data)
+
+        # 문자열은 항상 따옴표로 감싸 "\\N" 문자열이 NULL 로 읽히지 않도록 하고, 실수는 지수 표기 없이 씁니다.
+        conn = self.db.engine.raw_connection()
+        try:
+            with conn.cursor() as cursor:
+                with cursor.copy(stmt) as copy:
+                    for frame in data.iter_slices(self.copy_chunk_size):
+                        copy.write(
+                            frame.write_csv(
+                                include_header=False,
+                                null_value="\\N",
+                                quote_style="non_numeric",
+                                float_scientific=False,
+                            )
+                        )
+            conn.commit()
+        finally:
+            conn.close()
+
 
 class SQLiteDataSaver(BaseDataSaver):
     """
@@ -0,0 +1,66 @@
+import threading
+from collections.abc import Callable
+from typing import Literal
+
+import polars as pl
+
+from .data_manager import BaseDataManager
+
+
+class PolarsDataStage:
+    """
+    여러 DataSaver 가 공유하는 전처리 단계
+
+    DataManager 의 데이터가 바뀌면 transform 을 한 번만 계산하고,
+    등록된 DataSaver 들의 plan 을 pl.collect_all 로 함께 실행하여 Polars 가 최적화하고 병렬로 처리할 수 있도록 합니다.
+    """
+
+    def __init__(
+        self,
+        *data: BaseDataManager,
+        transform: Callable[..., pl.DataFrame],
+        engine: Literal["auto", "in-memory", "streaming"] = "streaming",
+    ):
+        """
+        Args:
+            data (BaseDataManager): 데이터를 가져올 DataManager
+            transform (Callable): DataManager 의 데이터를 받아 공유할 DataFrame 을 돌려주는 함수
+            engine (str): 등록된 DataSaver 의 plan 을 함께 collect 할 Polars 엔진
+        """
+        self.manager: tuple[BaseDataManager, ...] = tuple(data)
+        self.transform = transform
+        self._savers: list = []
+        self._version: tuple[int, ...] | None = None
+        self._frame: pl.DataFrame | None = None
+        self._results: dict | None = None
+        self.engine = engine
+        self._lock = threading.RLock()
+
+    def register(self, saver):
+        self._savers.append(saver)
+        self._results = None
+
+    @property
+    def frame(self) -> pl.DataFrame:
+        with self._lock:
+            version = tuple(m.version for m in self.manager)
+            if self._frame is None or version != self._version:
+                self._frame = self.transform(*(m.data for m in self.manager))
+                self._version = version
+                self._results = None
+            return self._frame
+
+    def lazy(self) -> pl.LazyFrame:
+        return self.frame.lazy()
+
+    def collect(self, saver) -> pl.DataFrame:
+        with self._lock:
+            frame = self.frame
+
+            if self._results is None:
+                results = pl.collect_all([s.plan(frame.lazy()) for s in self._savers], engine=self.engine)
+                self._results = dict(zip(self._savers, results, strict=True))
+
+            if saver in self._results:
+                return self._results.pop(saver)
+        return saver.plan(frame.lazy()).collect(engine=saver.engine)
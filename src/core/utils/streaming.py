@@ -0,0 +1,75 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Literal
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy import RowMapping
+
+type Partitions = AsyncIterator[Sequence[RowMapping]]
+type StreamFormat = Literal["json", "ndjson", "csv"]
+
+
+def _default(value: Any) -> str:
+    return str(value)
+
+
+async def iter_json(partitions: Partitions) -> AsyncIterator[bytes]:
+    """
+    행을 하나의 JSON 배열로 이어 붙여 내보냅니다. 결과는 result.mappings().all() 을 JSON 으로 만든 것과 같습니다.
+    """
+    prefix = b"["
+    async for rows in partitions:
+        if rows:
+            yield prefix + b",".join(orjson.dumps(dict(row), default=_default) for row in rows)
+            prefix = b","
+    yield b"[]" if prefix == b"[" else b"]"
+
+
+async def iter_ndjson(partitions: Partitions) -> AsyncIterator[bytes]:
+    """
+    한 줄에 한 행씩 JSON 으로 내보냅니다.
+    """
+    async for rows in partitions:
+        yield b"".join(orjson.dumps(dict(row), default=_default) + b"\n" for row in rows)
+
+
+async def iter_csv(partitions: Partitions) -> AsyncIterator[str]:
+    """
+    첫 partition 의 컬럼으로 header 를 쓰고 행을 CSV 로 내보냅니다.
+    """
+    buffer = io.StringIO()
+    writer = None
+
+    async for rows in partitions:
+        if not rows:
+            continue
+        if writer is None:
+            writer = csv.writer(buffer)
+            writer.writerow(rows[0].keys())
+        writer.writerows(row.values() for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def stream_response(partitions: Partitions, format: StreamFormat = "json", filename: str = "data") -> StreamingResponse:
+    """
+    Repository 의 stream 결과를 chunked 응답으로 만듭니다.
+    한 번에 yield_per 만큼의 행만 메모리에 올리므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        partitions (AsyncIterator): 행 묶음을 내보내는 비동기 iterator
+        format (str): json, ndjson, csv 중 하나
+        filename (str): csv 로 내려받을 때의 파일 이름
+    """
+    if format == "csv":
+        return StreamingResponse(
+            iter_csv(partitions),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
+        )
+    if format == "ndjson":
+        return StreamingResponse(iter_ndjson(partitions), media_type="application/x-ndjson")
+    return StreamingResponse(iter_json(partitions), media_type="application/json")
@@ -0,0 +1,85 @@
+import asyncio
+import random
+
+from src.core.utils.openapi.data_manager import BaseDataManager
+
+
+class DataRefreshWorker:
+    """
+    DataManager 의 데이터를 주기적으로 다시 불러오는 워커
+
+    같은 주기의 DataManager 들이 동시에 외부 API 를 호출하지 않도록 주기마다 jitter 를 더합니다.
+    함께 등록한 DataManager 들을 모두 다시 불러온 뒤 콜백을 한 번씩만 실행하므로,
+    DataSaver 가 일부만 갱신된 데이터로 여러 번 만들어지지 않습니다.
+    데이터가 바뀌지 않은 경우 DataManager 와 DataSaver 가 콜백 및 DB 쓰기를 건너뜁니다.
+    """
+
+    def __init__(self, jitter: float = 0.1):
+        """
+        Args:
+            jitter (float): 주기에 더할 무작위 비율 (0.1 이면 주기의 ±10%)
+        """
+        self.jitter = jitter
+        self._jobs: list[tuple[tuple[BaseDataManager, ...], float]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def add(self, *manager: BaseDataManager, interval: float):
+        """
+        Args:
+            manager (BaseDataManager): 함께 갱신할 DataManager
+            interval (float): 갱신 주기 (초)
+        """
+        self._jobs.append((manager, interval))
+
+    def start(self):
+        self._tasks = [asyncio.create_task(self._run(managers, interval)) for managers, interval in self._jobs]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def refresh(self, *managers: BaseDataManager, always_reload: bool = True):
+        """
+        DataManager 들을 모두 불러온 뒤, 데이터가 바뀐 DataManager 의 콜백을 중복 없이 한 번씩 실행합니다.
+
+        Args:
+            managers (BaseDataManager): 함께 갱신할 DataManager
+            always_reload (bool): 캐시를 무시하고 다시 불러올지 여부
+        """
+        changed = []
+        for manager in managers:
+            try:
+                if await manager.init(always_reload=always_reload, notify=False):
+                    changed.append(manager)
+                self.log(manager, manager in changed)
+            except Exception as e:
+                print(f"🔸Failed to refresh path={manager.path} error={e!r}")
+
+        try:
+            await self.notify(*changed)
+        except Exception as e:
+            print(f"🔸Failed to notify callbacks paths={[m.path for m in changed]} error={e!r}")
+
+    @staticmethod
+    async def notify(*managers: BaseDataManager):
+        """
+        여러 DataManager 에 등록된 콜백을 중복 없이 한 번씩 실행합니다.
+        """
+        callbacks = list(dict.fromkeys(callback for manager in managers for callback in manager.callbacks))
+        if callbacks:
+            await managers[0].notify_callbacks(callbacks)
+
+    @staticmethod
+    def log(manager: BaseDataManager, changed: bool):
+        refreshed_at = manager.last_refreshed_at.isoformat() if manager.last_refreshed_at else None
+        print(
+            f"🔹Refreshed path={manager.path} changed={changed} version={manager.version} "
+            f"duration={manager.last_refresh_duration:.3f}s refreshed_at={refreshed_at}"
+        )
+
+    async def _run(self, managers: tuple[BaseDataManager, ...], interval: float):
+        while True:
+            await asyncio.sleep(interval * (1 + random.uniform(-self.jitter, self.jitter)))
+            await self.refresh(*managers)
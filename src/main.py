@@ -21,6 +21,7 @@ def create_application(debug=False) -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=["X-Next-Cursor"],
         ),
         Middleware(
             ProxyHeadersMiddleware,  # type: ignore
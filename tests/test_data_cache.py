@@ -0,0 +1,75 @@
+import fakeredis
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from webtool.cache import RedisCache
+
+from src.core.utils.openapi.data_cache import RedisDataCache
+from src.core.utils.openapi.data_codec import ArrowDataCodec, JsonDataCodec, ParquetDataCodec
+
+
+@pytest.fixture
+def redis() -> RedisCache:
+    return RedisCache(connection_pool=fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()).connection_pool)
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame({"id": range(5000), "name": [f"row-{i}" for i in range(5000)]})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", [ArrowDataCodec(), ParquetDataCodec()])
+async def test_chunked_round_trip(redis, frame, codec):
+    data_cache = RedisDataCache(redis, key_prefix="test:", codec=codec, chunk_size=1024, chunk_batch_size=4)
+
+    await data_cache.set_cache("frame", frame)
+
+    chunk_keys = await redis.cache.keys("test:frame:chunk:*")
+    assert len(chunk_keys) > data_cache.chunk_batch_size
+    assert (await redis.get("test:frame")).startswith(b"chunked-manifest:")
+    assert_frame_equal(await data_cache.get_cache("frame"), frame)
+
+
+@pytest.mark.asyncio
+async def test_small_value_is_not_chunked(redis):
+    data_cache = RedisDataCache(redis, codec=JsonDataCodec(), chunk_size=1 << 20)
+
+    await data_cache.set_cache("small", [{"a": 1}])
+
+    assert await redis.cache.keys("small:chunk:*") == []
+    assert await data_cache.get_cache("small") == [{"a": 1}]
+
+
+@pytest.mark.asyncio
+async def test_overwrite_expires_previous_chunks(redis, frame):
+    data_cache = RedisDataCache(redis, codec=ArrowDataCodec(), chunk_size=1024)
+
+    await data_cache.set_cache("frame", frame)
+    previous = await redis.cache.keys("frame:chunk:*")
+    await data_cache.set_cache("frame", frame.head(10))
+
+    assert_frame_equal(await data_cache.get_cache("frame"), frame.head(10))
+    ttls = [await redis.cache.ttl(key) for key in previous]
+    assert previous and all(0 < ttl <= 60 for ttl in ttls)
+
+
+@pytest.mark.asyncio
+async def test_missing_chunk_is_a_cache_miss(redis, frame):
+    data_cache = RedisDataCache(redis, codec=ArrowDataCodec(), chunk_size=1024)
+
+    await data_cache.set_cache("frame", frame)
+    await redis.cache.delete((await redis.cache.keys("frame:chunk:*"))[0])
+
+    assert await data_cache.get_cache("frame") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_chunks(redis, frame):
+    data_cache = RedisDataCache(redis, codec=ArrowDataCodec(), chunk_size=1024)
+
+    await data_cache.set_cache("frame", frame)
+    await data_cache.delete_cache("frame")
+
+    assert await redis.cache.keys("*") == []
+    assert await data_cache.get_cache("frame") is None
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from src.core.utils.openapi.data_codec import ArrowDataCodec, JsonDataCodec, ParquetDataCodec
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "FSCL_YY": pl.Series([2024, 2025, None], dtype=pl.Int32),
+            "OFFC_NM": ["교육부", None, "국방부"],
+            "Y_YY_MEDI_KCUR_AMT": pl.Series([10**15, 0, None], dtype=pl.Int64),
+            "JA0101": [True, None, False],
+            "created_at": [datetime(2024, 1, 1), None, datetime(2025, 6, 30, 12)],
+        }
+    )
+
+
+@pytest.mark.parametrize("codec", [ArrowDataCodec(), ParquetDataCodec(), ParquetDataCodec(compression_level=3)])
+def test_binary_codecs_keep_schema(codec, frame):
+    decoded = codec.decode(codec.encode(frame))
+
+    assert decoded.schema == frame.schema
+    assert_frame_equal(decoded, frame)
+
+
+@pytest.mark.parametrize("codec", [ArrowDataCodec(), ParquetDataCodec()])
+def test_binary_codecs_accept_rows(codec):
+    assert codec.decode(codec.encode([{"a": 1, "b": "x"}])).to_dicts() == [{"a": 1, "b": "x"}]
+
+
+def test_json_codec_round_trip(frame):
+    codec = JsonDataCodec()
+    rows = [{"a": 1, "b": "가"}, {"a": None, "b": None}]
+
+    assert codec.decode(codec.encode(rows)) == rows
+    assert codec.decode(codec.encode(frame.drop("created_at"))) == frame.drop("created_at").to_dicts()
+
+
+def test_codecs_reject_each_other(frame):
+    # RedisDataCache 는 다른 codec 으로 저장된 값을 복원하지 못하면 캐시가 없는 것으로 취급합니다.
+    with pytest.raises(OSError):
+        JsonDataCodec().decode(ArrowDataCodec().encode(frame))
+    with pytest.raises(pl.exceptions.ComputeError):
+        ArrowDataCodec().decode(JsonDataCodec().encode([{"a": 1}]))
+    with pytest.raises(pl.exceptions.ComputeError):
+        ParquetDataCodec().decode(JsonDataCodec().encode([{"a": 1}]))
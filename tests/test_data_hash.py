@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from src.core.utils.openapi.data_hash import hash_df, hash_rows
+
+EXPECTED_ROW_HASHES = [12022105517673023348, 1146564324340730330]
+EXPECTED_DF_HASH = "a5e6ed132b19058ca196a6f08415137b4b3ef76a"
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "name": ["가", "b", None, ""],
+            "amount": [1.5, None, -0.0, 1e20],
+            "flag": [True, False, None, True],
+            "day": [date(2024, 1, 1), None, date(2025, 12, 31), date(1999, 1, 1)],
+            "at": [datetime(2024, 1, 1, 12), None, datetime(2025, 1, 1), datetime(2000, 1, 1)],
+        }
+    )
+
+
+def test_hash_df_is_independent_of_row_and_column_order(frame):
+    shuffled = frame.sample(fraction=1.0, shuffle=True, seed=7).select(reversed(frame.columns))
+
+    assert hash_df(shuffled) == hash_df(frame)
+
+
+def test_hash_df_is_independent_of_chunk_size(frame):
+    assert hash_df(frame, chunk_size=1) == hash_df(frame, chunk_size=3) == hash_df(frame)
+
+
+def test_hash_df_detects_changes(frame):
+    changed = frame.with_columns(pl.when(pl.col("id") == 2).then(pl.lit("c")).otherwise(pl.col("name")).alias("name"))
+
+    assert hash_df(changed) != hash_df(frame)
+    assert hash_df(frame.head(3)) != hash_df(frame)
+    assert hash_df(pl.concat([frame, frame.head(1)])) != hash_df(frame)
+    assert hash_df(frame.rename({"name": "title"})) != hash_df(frame)
+
+
+def test_hashes_are_stable():
+    # 프로세스나 Polars 버전이 바뀌어도 같아야 하는 값이므로 고정된 값과 비교합니다.
+    df = pl.DataFrame({"a": [1, None], "b": ["x", None]})
+
+    assert hash_rows(df).to_list() == hash_rows(df.clone()).to_list()
+    assert hash_rows(df).to_list() == EXPECTED_ROW_HASHES
+    assert hash_df(df) == EXPECTED_DF_HASH
+
+
+def test_hash_rows_distinguishes_null_from_empty_and_zero():
+    df = pl.DataFrame({"a": [None, 0], "b": [None, ""]})
+
+    first, second = hash_rows(df).to_list()
+    assert first != second
+
+
+def test_hash_rows_widens_integers():
+    narrow = pl.DataFrame({"a": pl.Series([1, -2, None], dtype=pl.Int8)})
+    wide = pl.DataFrame({"a": pl.Series([1, -2, None], dtype=pl.Int64)})
+
+    assert hash_rows(narrow).to_list() == hash_rows(wide).to_list()
+
+
+def test_hash_empty_frame():
+    df = pl.DataFrame(schema={"a": pl.Int64})
+
+    assert hash_rows(df).len() == 0
+    assert hash_df(df) == hash_df(df.clone())
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from src.core.utils.openapi.data_limiter import AdaptiveConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_success_increases_limit_additively():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=20)
+
+    for _ in range(4):
+        async with limiter.hold() as slot:
+            slot.succeeded = True
+
+    assert limiter.limit == pytest.approx(5.0, abs=0.1)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_stays_within_bounds():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1, max_limit=3)
+
+    for _ in range(50):
+        async with limiter.hold() as slot:
+            slot.succeeded = True
+    assert limiter.limit == 3
+
+    for _ in range(10):
+        async with limiter.hold() as slot:
+            slot.overloaded = True
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_overload_decreases_limit_once_per_generation():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+    generations = [await limiter.acquire() for _ in range(4)]
+    for generation in generations:
+        await limiter.release(generation, overloaded=True)
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_free_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.hold():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(10)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
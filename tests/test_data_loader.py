@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.core.utils.openapi import data_loader
+from src.core.utils.openapi.data_limiter import AdaptiveConcurrencyLimiter
+from src.core.utils.openapi.data_loader import OpenDataLoader, RetryPolicy
+
+BASE_URL = "http://stub"
+
+
+@pytest.fixture
+def delays(monkeypatch) -> list[float]:
+    recorded = []
+
+    async def sleep(delay: float):
+        recorded.append(delay)
+
+    monkeypatch.setattr(data_loader.asyncio, "sleep", sleep)
+    return recorded
+
+
+def make_loader(max_retries: int = 3, limiter: AdaptiveConcurrencyLimiter | None = None) -> OpenDataLoader:
+    return OpenDataLoader(
+        BASE_URL,
+        paths={"/data": {"get": {}}},
+        retry_policy=RetryPolicy(max_retries=max_retries, backoff_base=0.5, backoff_max=30.0),
+        limiter=limiter,
+    )
+
+
+def make_client(responses: list) -> httpx.AsyncClient:
+    """
+    응답 목록을 차례로 돌려주는 stub 서버, 예외 객체는 요청 시 발생시킵니다.
+    """
+    responses = iter(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+
+
+def test_retry_after_seconds_and_http_date():
+    assert RetryPolicy.get_retry_after(httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    assert RetryPolicy.get_retry_after(httpx.Response(429)) is None
+    assert RetryPolicy.get_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+
+    date = format_datetime(datetime.now(UTC) + timedelta(seconds=10), usegmt=True)
+    assert 0 < RetryPolicy.get_retry_after(httpx.Response(503, headers={"Retry-After": date})) <= 10
+
+
+def test_delay_uses_retry_after_capped_by_backoff_max():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=30.0)
+
+    assert policy.get_delay(0, retry_after=2.0) == 2.0
+    assert policy.get_delay(0, retry_after=120.0) == 30.0
+    assert all(0 <= policy.get_delay(attempt) <= min(30.0, 0.5 * 2**attempt) for attempt in range(10))
+
+
+@pytest.mark.asyncio
+async def test_request_retries_overload_and_honours_retry_after(delays):
+    loader = make_loader()
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"data": [1]}),
+    ]
+
+    async with make_client(responses) as client:
+        assert await loader.fetch_data(client, "/data") == {"data": [1]}
+
+    assert len(delays) == 2
+    assert delays[0] == 2.0
+    assert 0 <= delays[1] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_request_retries_transport_errors(delays):
+    loader = make_loader()
+    responses = [httpx.ConnectTimeout("timeout"), httpx.Response(200, json={"data": []})]
+
+    async with make_client(responses) as client:
+        assert await loader.fetch_data(client, "/data") == {"data": []}
+    assert len(delays) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_gives_up_after_max_retries(delays):
+    loader = make_loader(max_retries=2)
+
+    async with make_client([httpx.Response(500)] * 3) as client:
+        with pytest.raises(ValueError, match="500"):
+            await loader.fetch_data(client, "/data")
+    assert len(delays) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_client_errors(delays):
+    loader = make_loader()
+
+    async with make_client([httpx.Response(404)]) as client:
+        with pytest.raises(ValueError, match="404"):
+            await loader.fetch_data(client, "/data")
+    assert delays == []
+
+
+@pytest.mark.asyncio
+async def test_request_feeds_limiter(delays):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    loader = make_loader(limiter=limiter)
+
+    async with make_client([httpx.Response(429), httpx.Response(200, json={})]) as client:
+        await loader.fetch_data(client, "/data")
+
+    assert 4 < limiter.limit < 5
+    assert limiter.in_flight == 0
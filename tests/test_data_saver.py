@@ -0,0 +1,100 @@
+import csv
+import io
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+from sqlalchemy import BigInteger, Integer, Text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.core.utils.openapi.data_saver import PostgresDataSaver
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Budget(Base):
+    __tablename__ = "budget"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    year: Mapped[int] = mapped_column(Integer)
+    name: Mapped[str] = mapped_column(Text, nullable=True)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=True)
+
+
+class RecordingConnection:
+    """
+    COPY FROM STDIN 으로 전송된 문장과 데이터를 기록하는 psycopg 연결 대역
+    """
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.chunks: list[str] = []
+        self.committed = False
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def copy(self, statement: str):
+        self.statements.append(statement)
+        return self
+
+    def write(self, data: str):
+        self.chunks.append(data)
+
+    def commit(self):
+        self.committed = True
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+@pytest.fixture
+def connection() -> RecordingConnection:
+    return RecordingConnection()
+
+
+@pytest.fixture
+def saver(connection) -> PostgresDataSaver:
+    engine = SimpleNamespace(dialect=postgresql.dialect(), raw_connection=lambda: connection)
+    return PostgresDataSaver(db=SimpleNamespace(engine=engine), table=Budget, loader="copy", copy_chunk_size=2)
+
+
+def test_cast_integer_columns(saver):
+    data = pl.DataFrame({"year": [2024.0, None], "name": ["a", "b"], "amount": [1.5e15, 3.0], "ratio": [0.5, 1.5]})
+
+    cast = saver._cast_integer_columns(data)
+
+    assert cast.schema == {"year": pl.Int64, "name": pl.String, "amount": pl.Int64, "ratio": pl.Float64}
+    assert cast["amount"].to_list() == [1_500_000_000_000_000, 3]
+
+
+def test_copy_writes_quoted_csv_in_chunks(saver, connection):
+    data = pl.DataFrame(
+        {
+            "year": [2024.0, 2025.0, 2026.0],
+            "name": ["\\N", None, 'a,"b"'],
+            "amount": [1.5e15, None, 7.0],
+        }
+    )
+
+    saver._copy(data, "budget__staging")
+
+    assert connection.statements == ["COPY budget__staging (year, name, amount) FROM STDIN (FORMAT CSV, NULL '\\N')"]
+    assert len(connection.chunks) == 2
+    assert connection.committed and connection.closed
+
+    rows = list(csv.reader(io.StringIO("".join(connection.chunks))))
+    assert rows == [["2024", "\\N", "1500000000000000"], ["2025", "\\N", "\\N"], ["2026", 'a,"b"', "7"]]
+    # 문자열 "\N" 은 따옴표로 감싸서 NULL 과 구분되어야 합니다.
+    assert connection.chunks[0].startswith('2024,"\\N",1500000000000000')
+    assert ",\\N,\\N" in connection.chunks[0]
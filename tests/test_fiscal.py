@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+from sqlalchemy import create_engine
+
+from src.app.open_api.model.fiscal import (
+    FiscalByYearDataSaver,
+    FiscalByYearOffcDataSaver,
+    FiscalDataSaver,
+    FiscalDepartmentRegistry,
+    fiscal_key,
+    normalize_fiscal,
+    number_departments,
+)
+from src.core.utils.openapi.data_saver import check_unique_keys
+
+AMOUNTS = ["Y_PREY_FIRST_KCUR_AMT", "Y_PREY_FNL_FRC_AMT", "Y_YY_MEDI_KCUR_AMT", "Y_YY_DFN_MEDI_KCUR_AMT"]
+
+
+def plan(saver: type, stage: pl.DataFrame) -> pl.DataFrame:
+    return saver.plan(None, stage.lazy()).collect()
+
+
+@pytest.fixture
+def raw() -> pl.DataFrame:
+    row = {key: key for key in fiscal_key} | {"FSCL_YY": "2024", "OFFC_NM": "교육부", "ANEXP_INQ_STND_CD": "1"}
+    rows = [
+        row
+        | {
+            "Y_PREY_FIRST_KCUR_AMT": 1,
+            "Y_PREY_FNL_FRC_AMT": None,
+            "Y_YY_MEDI_KCUR_AMT": 10,
+            "Y_YY_DFN_MEDI_KCUR_AMT": None,
+        },
+        row
+        | {
+            "Y_PREY_FIRST_KCUR_AMT": 2,
+            "Y_PREY_FNL_FRC_AMT": None,
+            "Y_YY_MEDI_KCUR_AMT": 20,
+            "Y_YY_DFN_MEDI_KCUR_AMT": 5,
+        },
+        row | {"OFFC_NM": None, "ACCT_NM": None, **dict.fromkeys(AMOUNTS, 100)},
+        row | {"FSCL_YY": "2025", "OFFC_NM": "국가유산청", **dict.fromkeys(AMOUNTS, 7)},
+        row | {"FSCL_YY": "2025", "OFFC_NM": "문화재청", **dict.fromkeys(AMOUNTS, None)},
+    ]
+    return pl.DataFrame(rows, schema_overrides=dict.fromkeys(AMOUNTS, pl.Int64))
+
+
+def test_detail_rows_merge_duplicate_keys_by_sum(raw):
+    stage = normalize_fiscal(raw)
+    detail = plan(FiscalDataSaver, stage)
+
+    check_unique_keys(detail, fiscal_key)
+    assert detail.height == 4
+    assert detail.select(AMOUNTS).sum().row(0) == stage.select(AMOUNTS).sum().row(0)
+
+    merged = detail.filter(pl.col("OFFC_NM") == "교육부").row(0, named=True)
+    assert merged["Y_PREY_FIRST_KCUR_AMT"] == 3
+    assert merged["Y_PREY_FNL_FRC_AMT"] is None
+    assert merged["Y_YY_DFN_MEDI_KCUR_AMT"] == 5
+
+
+def test_aggregates_use_every_stage_row(raw):
+    stage = normalize_fiscal(raw)
+
+    by_year = plan(FiscalByYearDataSaver, stage)
+    by_year_offc = plan(FiscalByYearOffcDataSaver, stage)
+
+    assert by_year["Y_YY_MEDI_KCUR_AMT"].to_list() == [130, 7]
+    assert by_year_offc.filter(pl.col("OFFC_NM") == "교육부")["COUNT"].item() == 2
+
+
+def test_number_departments_keeps_saved_numbers():
+    first = number_departments(["나", "다", "국가유산청", "문화재청"])
+    assert first == {"국가유산청": 0, "나": 1, "다": 2, "문화재청": 0}
+
+    second = number_departments(["가", "나", "다", "국가유산청", "문화재청"], first)
+    assert {name: second[name] for name in first} == first
+    assert second["가"] == 3
+
+
+def test_registry_persists_numbers(raw):
+    registry = FiscalDepartmentRegistry(SimpleNamespace(engine=create_engine("sqlite://")))
+
+    before = normalize_fiscal(raw, registry)
+    after = normalize_fiscal(pl.concat([raw, raw.head(1).with_columns(pl.lit("가나부").alias("OFFC_NM"))]), registry)
+
+    numbers = dict(before.select("OFFC_NM", "NORMALIZED_DEPT_NO").unique().iter_rows())
+    assert (
+        dict(after.filter(pl.col("OFFC_NM") != "가나부").select("OFFC_NM", "NORMALIZED_DEPT_NO").unique().iter_rows())
+        == numbers
+    )
+    assert after.filter(pl.col("OFFC_NM") == "가나부")["NORMALIZED_DEPT_NO"].item() == max(numbers.values()) + 1
+    assert numbers["국가유산청"] == numbers["문화재청"]
@@ -0,0 +1,127 @@
+import random
+from datetime import datetime
+
+import pytest
+from sqlalchemy import DateTime, Integer, create_engine, desc
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from src.core.models.repository import BaseReadRepository, decode_cursor, encode_cursor
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    score: Mapped[int] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+
+@pytest.fixture
+def repository() -> BaseReadRepository[Item]:
+    return BaseReadRepository(Item)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    rng = random.Random(0)
+    with Session(engine) as session:
+        session.add_all(
+            Item(id=i, score=rng.randint(0, 5), created_at=datetime(2024, 1, 1 + i % 3)) for i in range(1, 101)
+        )
+        session.commit()
+        yield session
+
+
+def compile_postgres(clauses) -> str:
+    return " ".join(str(c.compile(dialect=postgresql.dialect())) for c in clauses)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("created_at", datetime(2024, 5, 1, 12, 30), 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ["created_at", "2024-05-01T12:30:00", 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor("score", 1), encode_cursor("other", 1, 2), "e30"])
+def test_invalid_cursor(repository, cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        repository._get_cursor_values(Item.score, cursor)
+
+
+def test_cursor_values_keep_column_type(repository):
+    value, last_id = repository._get_cursor_values(
+        Item.created_at, encode_cursor("created_at", datetime(2024, 5, 1), 7)
+    )
+
+    assert value == datetime(2024, 5, 1)
+    assert last_id == 7
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        repository._get_cursor_values(Item.created_at, encode_cursor("created_at", "yesterday", 7))
+
+
+def test_seek_after_null_value(repository):
+    seek, _ = repository._seek(Item.score, (None, 10), descending=True)
+    assert compile_postgres(seek) == "item.score IS NULL AND item.id < %(param_1)s::INTEGER OR item.score IS NOT NULL"
+
+    seek, _ = repository._seek(Item.score, (None, 10), descending=False)
+    assert compile_postgres(seek) == "item.score IS NULL AND item.id > %(param_1)s::INTEGER"
+
+
+def test_seek_after_value(repository):
+    seek, orderby = repository._seek(Item.score, (3, 10), descending=True)
+    assert compile_postgres(seek) == "(item.score, item.id) < (%(param_1)s::INTEGER, %(param_2)s::INTEGER)"
+    assert compile_postgres(orderby) == "item.score DESC item.id DESC"
+
+    # 오름차순에서는 NULL 이 마지막이므로 값이 있는 cursor 뒤에 NULL 행이 이어집니다.
+    seek, _ = repository._seek(Item.score, (3, 10), descending=False)
+    assert (
+        compile_postgres(seek)
+        == "(item.score, item.id) > (%(param_1)s::INTEGER, %(param_2)s::INTEGER) OR item.score IS NULL"
+    )
+
+
+def test_seek_binds_cursor_with_column_type(repository):
+    seek, _ = repository._seek(Item.created_at, (datetime(2024, 1, 1), 10), descending=True, bind=True)
+    params = seek[0].compile(dialect=postgresql.dialect()).params
+
+    assert params == {"_cursor_value": datetime(2024, 1, 1), "_cursor_id": 10}
+
+
+@pytest.mark.parametrize("shape", [None, ("items",)])
+@pytest.mark.parametrize("descending", [True, False])
+def test_cursor_walk_visits_every_row_once(repository, session, shape, descending):
+    expected = sorted(session.query(Item.score, Item.id).all(), reverse=descending)
+
+    seen, cursor = [], None
+    while True:
+        result = repository.get_cursor_page(
+            session, 7, None, Item.score, cursor, descending=descending, shape=shape and (*shape, descending)
+        )
+        rows = result.mappings().all()
+        seen.extend((row["score"], row["id"]) for row in rows)
+        if not (cursor := repository.get_next_cursor(rows, Item.score, 7)):
+            break
+
+    assert seen == [tuple(row) for row in expected]
+
+
+def test_cursor_continues_offset_page(repository, session):
+    # offset 페이지도 (column, id) 로 정렬해야 응답의 cursor 로 이어서 읽을 때 행이 빠지거나 겹치지 않습니다.
+    expected = sorted(session.query(Item.score, Item.id).all(), reverse=True)
+
+    # SQLite 는 get_page 의 FETCH FIRST 를 지원하지 않으므로 같은 정렬로 읽은 결과의 앞부분을 첫 페이지로 씁니다.
+    first = repository.get(session, [], orderby=[desc(Item.score), desc(Item.id)]).mappings().all()[:7]
+    cursor = repository.get_next_cursor(first, Item.score, 7)
+    rest = repository.get_cursor_page(session, 100, None, Item.score, cursor).mappings().all()
+
+    assert [(row["score"], row["id"]) for row in [*first, *rest]] == [tuple(row) for row in expected]